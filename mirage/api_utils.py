@@ -26,10 +26,7 @@ from contextlib import contextmanager
 
 # internal
 import vfx_utils.omni.slog as slog
-from vfx_utils.omni.data_types import cached_property, allocated_list
-
-# third-party
-from PySide2.QtCore import QFile
+from vfx_utils.omni.data_types import cached_property
 
 # domain
 import maya.cmds as cmds
@@ -61,6 +58,22 @@ _fn_data_type_dict = dict()
 _fn_numeric_data_type_dict = dict()
 # cache of MFnUnitData::Type
 _fn_unit_type_dict = dict()
+# attribute MObjects by (node type name, attribute name).  Static attributes
+# are shared by every node of a type, so a plug can be built from the
+# cached attribute without findPlug resolving the name again
+_attr_mobj_cache = dict()
+# leaf attribute values by (node hash, plug name), and DAG parents by node
+# hash, only while a memoized_values() block is active.  None the rest of
+# the time
+_value_cache = None
+_parent_cache = None
+# the only leaf values memoized_values() hands out to more than one reader
+_immutable_values = (bool, int, long, float, basestring)
+
+# ------------------- Modifiers -------------------------------------------- #
+# the MDGModifier shared by dg_modifier() while a batch_connections() block
+# is active
+_batch_modifier = None
 
 # ------------------- Regexes ---------------------------------------------- #
 # for checking to see if a string is a UUID
@@ -74,10 +87,8 @@ uuid_check = re.compile('[A-Z0-9]{8}-.+')
 
 # ------------------- Function Sets ---------------------------------------- #
 _fn_dag = om.MFnDagNode()
-_cur_fn_dag = None
 _fn_dag_set_obj = _fn_dag.setObject
 _fn_dg = om.MFnDependencyNode()
-_cur_fn_dg = None
 _fn_dg_set_obj = _fn_dg.setObject
 _fn_attr = om.MFnAttribute()
 _fn_attr_set_obj = _fn_attr.setObject
@@ -102,7 +113,17 @@ _tmp_sel_list = om.MSelectionList()
 _tmp_sel_list_add = _tmp_sel_list.add
 _tmp_sel_list_clear = _tmp_sel_list.clear
 
+# ------------------- Plug Methods ----------------------------------------- #
+# ApiAttribute reads these from every plug it wraps
+_plug_attribute = om.MPlug.attribute
+_plug_name = om.MPlug.name
+_plug_is_array = om.MPlug.isArray
+_plug_is_compound = om.MPlug.isCompound
+
 # ------------------- Arrays ----------------------------------------------- #
+# the shared plug array is only safe because every user copies the plugs
+# it needs out of it (om.MPlug(_mplug_array[i])) before calling anything
+# that could fill it again.  Keep it that way when adding new users.
 _mplug_array = om.MPlugArray()
 _mplug_array_clear = _mplug_array.clear
 _mplug_array_len = _mplug_array.length
@@ -176,21 +197,25 @@ class ApiNode(object):
     def plug(self, plug_name):
         """retrieve the plug with the given name."""
         try:
-            _plug = self._plugs.setdefault(plug_name, self.fn_dg.findPlug(plug_name))
+            return self._plugs[plug_name]
+        except KeyError:
+            pass
+        try:
+            attr_mobj = _attr_mobj_of(self.fn_dg, self.type_name, plug_name)
         except RuntimeError:
             error_msg = ('the given node {0} does not have an attribute '
                          'called {1}'.format(self.name, plug_name))
             raise AttributeError(error_msg)
+        _plug = self._plugs[plug_name] = om.MPlug(self.obj, attr_mobj)
         return _plug
 
     def attr(self, attr_name, extend_to_shape=True):
         """create an ApiAttribute for the given attribute name. Result is
         cached to instance dict - see self._attrs"""
-        # see if attr object is cached
-        try:
-            return self._attrs[attr_name]
-        except:
-            pass
+        # see if attr object is cached.  The cache never holds None
+        _attr = self._attrs.get(attr_name)
+        if _attr is not None:
+            return _attr
         # the shenanigans below are necessary in order to check against
         # a bunch of different potential failure states.
         _attr = None
@@ -221,11 +246,14 @@ class ApiNode(object):
     @property
     def all_plugs(self):
         """list all top-level plugs on this ApiNode"""
-        _fn_dg_set_obj(self.obj)
-        attr_objs = [_fn_dg.attribute(i) for i in range(_fn_dg.attributeCount())]
-        plugs = [om.MPlug(self.obj, attr) for attr in attr_objs]
+        obj = self.obj
+        _fn_dg_set_obj(obj)
+        attribute = _fn_dg.attribute
+        mplug = om.MPlug
         # we ignore children because they are accounted for by the parents
-        return [plug for plug in plugs if not plug.isChild()]
+        return [plug for plug in (mplug(obj, attribute(i))
+                                  for i in xrange(_fn_dg.attributeCount()))
+                if not plug.isChild()]
 
     def list_attributes(self, extend_to_shape=True):
         """get a list of all attributes on this node as ApiAttributes."""
@@ -241,11 +269,16 @@ class ApiNode(object):
         return [ApiAttribute(plug) for plug in plugs]
 
     def has_attribute(self, attribute_as_string):
-        return attribute_as_string in cmds.listAttr(self.name)
+        return self.fn_dg.hasAttribute(attribute_as_string)
 
     @property
     def all_connected_plugs(self):
         """list all plugs on this ApiNode with external connections"""
+        return self._connected_plugs()
+
+    def _connected_plugs(self, plug_filter=None):
+        """list the connected plugs on this ApiNode which pass the given
+        filter, an unbound MPlug method such as om.MPlug.isSource"""
         _mplug_array_clear()
         try:
             self.fn_dg.getConnections(_mplug_array)
@@ -255,16 +288,30 @@ class ApiNode(object):
         except RuntimeError:
             return []
         else:
-            num_plugs = _mplug_array_len()
-            plugs = allocated_list(num_plugs)
-            for i in range(num_plugs):
-                # making a copy of the plug object prevents maya crash
-                plugs[i] = om.MPlug(_mplug_array[i])
-            return plugs
+            plug_array = _mplug_array
+            mplug = om.MPlug
+            # making a copy of the plug object prevents maya crash.  Plugs
+            # are filtered in the array first, so only the ones we keep
+            # are copied
+            if plug_filter is None:
+                return [mplug(plug_array[i])
+                        for i in xrange(_mplug_array_len())]
+            return [mplug(plug) for plug in (plug_array[i] for i
+                                             in xrange(_mplug_array_len()))
+                    if plug_filter(plug)]
+
+    # connection modes for list_connections, and the plugs they keep
+    _connection_filters = {'destination': om.MPlug.isDestination,
+                           'source': om.MPlug.isSource,
+                           'all': None}
 
     def list_connections(self, mode='destination', extend_to_shape=True):
         """get a list of all connections on this node as ApiAttributes"""
-        plugs = self.all_connected_plugs
+        try:
+            plug_filter = self._connection_filters[mode]
+        except KeyError:
+            return None
+        plugs = self._connected_plugs(plug_filter)
         if extend_to_shape:
             try:
                 shape = self.shape
@@ -272,14 +319,8 @@ class ApiNode(object):
                 pass
             else:
                 if shape and shape != self:
-                    plugs.extend(shape.all_connected_plugs)
-        if mode == 'destination':
-            return [ApiAttribute(plug) for plug in plugs
-                    if plug.isDestination()]
-        elif mode == 'source':
-            return [ApiAttribute(plug) for plug in plugs if plug.isSource()]
-        elif mode == 'all':
-            return [ApiAttribute(plug) for plug in plugs]
+                    plugs.extend(shape._connected_plugs(plug_filter))
+        return [ApiAttribute(plug) for plug in plugs]
 
     @property
     def inputs(self):
@@ -346,10 +387,9 @@ class ApiNode(object):
     def long_name(self):
         """return the full path name for dag nodes, or just the name of
         the dg node"""
-        try:
+        if self.is_dag:
             return self.fn_dag.fullPathName()
-        except TypeError:
-            return self.name
+        return self.name
 
     @property
     def short_name(self):
@@ -360,12 +400,10 @@ class ApiNode(object):
     @property
     def fn_dag(self):
         """return the DAG function set for this node"""
-        global _cur_fn_dag
-        obj = self.obj
-        if _cur_fn_dag is obj:
-            return _fn_dag
+        # the function sets are shared with the module functions, which
+        # point them at other objects, so they are always set again
         try:
-            _fn_dag_set_obj(obj)
+            _fn_dag_set_obj(self.obj)
         except RuntimeError:
             raise TypeError('A RuntimeError was caught in fn_dag.  This could '
                             'be caused by trying to get a fn_dag from a '
@@ -374,18 +412,12 @@ class ApiNode(object):
             # any other weirdness, just raise the error...
             raise
         else:
-            _cur_fn_dag = obj
             return _fn_dag
 
     @property
     def fn_dg(self):
         """return the DG function set for this node"""
-        global _cur_fn_dg
-        obj = self.obj
-        if _cur_fn_dg is obj:
-            return _fn_dg
-        _fn_dg_set_obj(obj)
-        _cur_fn_dg = obj
+        _fn_dg_set_obj(self.obj)
         return _fn_dg
 
     # ------------------- Statuses ------------------------------------ #
@@ -417,8 +449,9 @@ class ApiNode(object):
         self.locked = True
 
     # ------------------- Hierarchy ----------------------------------- #
-    @property
+    @cached_property
     def is_dag(self):
+        # a node can't change between DG and DAG, so this is asked once
         return self.obj.hasFn(om.MFn.kDagNode)
 
     @property
@@ -431,6 +464,9 @@ class ApiNode(object):
 
     @parent.setter
     def parent(self, api_node):
+        # world-space values change along with the hierarchy
+        _clear_parent_cache()
+        _clear_value_cache()
         with dag_modifier() as modify_stack:
             try:
                 modify_stack.reparentNode(self.obj, api_node.obj)
@@ -447,10 +483,9 @@ class ApiNode(object):
 
     @property
     def children(self):
-        children = []
-        for i in range(self.fn_dag.childCount()):
-            children.append(self.fn_dag.child(i))
-        return [ApiNode.from_mobject(child) for child in children]
+        fn_dag = self.fn_dag
+        child = fn_dag.child
+        return [ApiNode(child(i)) for i in xrange(fn_dag.childCount())]
 
     @property
     def descendants(self):
@@ -525,6 +560,8 @@ class ApiNode(object):
             shape_type = shape.api_type
         out_icon_name = ':/out_{}{}.png'.format(shape_type[1:2].lower(),
                                                 shape_type[2:])
+        # Qt is only needed here, so it isn't loaded with the module
+        from PySide2.QtCore import QFile
         test_file = QFile(out_icon_name)
         return out_icon_name if test_file.exists() else ':/out_default.png'
 
@@ -570,12 +607,15 @@ class ApiNode(object):
         return hash(self.mhash)
 
     def __eq__(self, other):
+        # the handle hash is cached, so most comparisons are a single
+        # integer compare.  Hashes can collide, so a match is confirmed
+        # against the MObjects themselves
         try:
-            return self.uuid == other.uuid
+            if self.mhash != other.mhash:
+                return False
+            return self.obj == other.obj
         except AttributeError:
             return False
-        else:
-            return False
 
     # ------------------- Get and Set Maya Attributes ---------------------- #
     def __getitem__(self, attr_name):
@@ -665,6 +705,15 @@ class ApiAttribute(object):
                       'kString': getset_string,
                       'kChar': getset_char,
                       }
+    # data types handled by methods of the instance, by method name.  See
+    # instance_getter_setters
+    _instance_getter_setter_names = {
+        'kMessageAttribute': ('_get_message', '_set_message'),
+        'kAngle': ('_get_angle', '_set_angle'),
+        'kMatrix': ('_get_matrix', '_set_unhandled')}
+    # (row, column) cells in the order _get_matrix returns them: one list
+    # per column of the MMatrix
+    _matrix_cells = tuple(tuple((i, j) for i in range(4)) for j in range(4))
 
     # ----------------------------------------------------- Methods -- #
 
@@ -675,32 +724,67 @@ class ApiAttribute(object):
         """
         # ------------------- Instance Attrs ------------------------- #
         self.plug = plug
-        self.attribute = plug.attribute()
-        self.full_name = str(plug.name())
+        self.attribute = _plug_attribute(plug)
+        self.full_name = str(_plug_name(plug))
         # TODO: make the short name a cachable lazy property
         self.name = ''.join(self.full_name.split('.')[1:])
-        self.attr_type = attr_type(self.attribute)
-        self.is_array = plug.isArray()
-        self.is_compound = plug.isCompound()
-        self.data_type = data_type(self.attribute, self.attr_type)
-        # ------------------- Instance Getters and Setters ----------- #
-        self.getter_setters = dict(ApiAttribute.getter_setters)
-        self.getter_setters.update(self.instance_getter_setters)
-        getset = self.getter_setters.get(self.data_type,
-                                         (self._get_unhandled,
-                                          self._set_unhandled))
-        self.getter, self.setter = getset
+        # typing, and the getter and setter that go with it, are cached
+        # properties (see below), since many callers only want the names
         # ------------------- Caches --------------------------------- #
         self._apinode = None
 
+    # --------------------------------------------------- Typing -- #
+    @cached_property
+    def attr_type(self):
+        return attr_type(self.attribute)
+
+    @cached_property
+    def data_type(self):
+        return data_type(self.attribute, self.attr_type)
+
+    @cached_property
+    def is_array(self):
+        return _plug_is_array(self.plug)
+
+    @cached_property
+    def is_compound(self):
+        return _plug_is_compound(self.plug)
+
+    # -------------------------------------- Getters and Setters -- #
+    @cached_property
+    def _getter_setter(self):
+        """the (getter, setter) pair for this attribute's data type, and
+        whether it is a known type at all"""
+        # the shared table is consulted directly; only the few types
+        # handled by this instance's own methods need binding
+        getset = ApiAttribute.getter_setters.get(self.data_type)
+        if getset is not None:
+            return getset, True
+        names = self._instance_getter_setter_names.get(self.data_type)
+        if names is None:
+            return (self._get_unhandled, self._set_unhandled), False
+        return (getattr(self, names[0]), getattr(self, names[1])), True
+
+    @cached_property
+    def getter(self):
+        return self._getter_setter[0][0]
+
+    @cached_property
+    def setter(self):
+        return self._getter_setter[0][1]
+
+    @cached_property
+    def has_getter_setter(self):
+        return self._getter_setter[1]
+
     @property
     def instance_getter_setters(self):
         """the dictionary of attribute getters and setters specific to
         this particular instance
         """
-        return {'kMessageAttribute': (self._get_message, self._set_message),
-                'kAngle': (self._get_angle, self._set_angle),
-                'kMatrix': (self._get_matrix, self._set_unhandled)}
+        return dict((data_type_, (getattr(self, get), getattr(self, set_)))
+                    for data_type_, (get, set_)
+                    in self._instance_getter_setter_names.iteritems())
 
     # -------------------------------------- Alternate Constructors -- #
     @classmethod
@@ -726,12 +810,12 @@ class ApiAttribute(object):
         """
         _fn_dg_set_obj(mobject)
         try:
-            plug = _fn_dg.findPlug(attr)
+            attr_mobj = _attr_mobj_of(_fn_dg, _fn_dg.typeName(), attr)
         except RuntimeError:
             msg = ('An error was thrown attempting to get the ApiAttribute '
                    'for {0}.{1}'.format(name_of(mobject), attr))
             raise AttributeError(msg)
-        return cls(plug)
+        return cls(om.MPlug(mobject, attr_mobj))
 
     @classmethod
     def from_apinode_and_string(cls, api_node, attr):
@@ -757,11 +841,13 @@ class ApiAttribute(object):
     def destinations(self):
         _mplug_array_clear()
         self.plug.destinations(_mplug_array)
-        num_plugs = _mplug_array_len()
-        dest_array = allocated_list(num_plugs)
-        for i in range(num_plugs):
-            dest_array[i] = ApiAttribute(_mplug_array[i])
-        return dest_array
+        plug_array = _mplug_array
+        mplug = om.MPlug
+        api_attribute = ApiAttribute
+        # the shared array is cleared by the next call, so every plug is
+        # copied out of it, as in all_connected_plugs
+        return [api_attribute(mplug(plug_array[i]))
+                for i in xrange(_mplug_array_len())]
 
     @cached_property
     def short_name(self):
@@ -791,10 +877,11 @@ class ApiAttribute(object):
         if isinstance(value, ApiAttribute):
             return 'connection: {}'.format(value.full_name)
         elif isinstance(value, list):
-            ret_list = []
-            for item in value:
-                ret_list.append(self._recurse_serialize(item))
-            return ret_list
+            # plain elements are handled in place; only nested lists
+            # cost another call
+            recurse = self._recurse_serialize
+            return [recurse(item) if isinstance(item, (list, ApiAttribute))
+                    else item for item in value]
         else:
             return value
 
@@ -810,53 +897,107 @@ class ApiAttribute(object):
         """return the value or list of values associated with the plug"""
 
         # ------------------- Handle Connected Attrs ----------------- #
+        # connections can change at any time, so they are checked on
+        # every read
         if self.plug.isDestination():
             _mplug_array_clear()
             self.plug.connectedTo(_mplug_array, True, False)
             return ApiAttribute(om.MPlug(_mplug_array[0]))
+        return self._value_getter()
 
-        # ------------------- Handle Arrays -------------------------- #
-        elif self.is_array and self.data_type not in self.getter_setters:
-            all_element_values = []
-            element_indexes = om.MIntArray()
-            self.plug.getExistingArrayAttributeIndices(element_indexes)
-            for i in element_indexes:
-                try:
-                    element_plug = self.plug.elementByLogicalIndex(i)
-                except RuntimeError:
-                    logger.exception('The element you\'re attempting to '
-                                     'access is not available')
-                    raise
-                else:
-                    new_att = ApiAttribute(element_plug)
-                    all_element_values.append(new_att.value)
-            return all_element_values
-
-        # ------------------- Handle Compounds ----------------------- #
+    @cached_property
+    def _value_getter(self):
+        """the method that reads this attribute's value.  Whether a plug
+        is an array or a compound never changes, so the choice is made
+        once, on the first read"""
+        if self.is_array and not self.has_getter_setter:
+            return self._get_array_value
         elif self.is_compound:
-            compound_len = self.plug.numChildren()
-            all_element_values = allocated_list(compound_len)
-            # compound attributes aren't necessarily all of the same
-            # type.  If the compound attr doesn't have a specific type,
-            # we must recurse:
-            for i in range(compound_len):
-                child_plug = self.plug.child(i)
-                new_att = ApiAttribute(child_plug)
-                all_element_values[i] = new_att.value
-            return all_element_values
-
-        # ------------------- Handle All Other Attrs ----------------- #
+            return self._get_compound_value
+        return self._get_leaf_value
+
+    def _get_array_value(self):
+        element_indexes = om.MIntArray()
+        self.plug.getExistingArrayAttributeIndices(element_indexes)
+        element_by_index = self.plug.elementByLogicalIndex
+        # every element plug is fetched under a single try, rather than
+        # one per element.  The MIntArray is indexed directly; iterating
+        # it falls back on __getitem__ anyway, and ends in an IndexError
         try:
-            return self.getter(self.plug)
+            element_plugs = [element_by_index(element_indexes[k])
+                             for k in xrange(element_indexes.length())]
+        except RuntimeError:
+            logger.exception('The element you\'re attempting to '
+                             'access is not available')
+            raise
+        api_attribute = ApiAttribute
+        return [api_attribute(element_plug).value
+                for element_plug in element_plugs]
+
+    def _get_compound_value(self):
+        plug = self.plug
+        child = plug.child
+        api_attribute = ApiAttribute
+        # compound attributes aren't necessarily all of the same
+        # type, so every child is typed on its own.  Inside a
+        # memoized_values() block each child goes through .value,
+        # which holds the cache
+        if _value_cache is not None:
+            return [api_attribute(child(i)).value
+                    for i in xrange(plug.numChildren())]
+        # plain children of a type in the shared table are read
+        # directly, without an ApiAttribute each.  Connected, array
+        # and compound children, and the instance-handled types,
+        # still recurse, reusing the data type already looked up
+        getter_setters = api_attribute.getter_setters
+        values = []
+        append = values.append
+        for i in xrange(plug.numChildren()):
+            child_plug = child(i)
+            if (child_plug.isDestination()
+                    or _plug_is_array(child_plug)
+                    or _plug_is_compound(child_plug)):
+                append(api_attribute(child_plug).value)
+                continue
+            attribute = _plug_attribute(child_plug)
+            child_data_type = data_type(attribute, attr_type(attribute))
+            getset = getter_setters.get(child_data_type)
+            if getset is not None:
+                append(getset[0](child_plug))
+            else:
+                child_attr = api_attribute(child_plug)
+                child_attr.data_type = child_data_type
+                append(child_attr.value)
+        return values
+
+    def _get_leaf_value(self):
+        # inside a memoized_values() block, leaves shared by many reads
+        # (compound children, array elements) are only forced once.  Only
+        # numbers and strings are kept: every reader would share a cached
+        # list (matrices, data arrays) or wrapper (message connections)
+        cache = _value_cache
+        if cache is not None:
+            key = (om.MObjectHandle(self.plug.node()).hashCode(),
+                   self.full_name)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+        try:
+            value = self.getter(self.plug)
         except RuntimeError:
             # if none of the above works, log a warning and move on.
             raise
             logger.error('An error was caught trying to get the value of {0}',
                          self.full_name)
             pass
+        if cache is not None and isinstance(value, _immutable_values):
+            cache[key] = value
+        return value
 
     @value.setter
     def value(self, value):
+        _clear_value_cache()
 
         # -- Handle Array Attrs -------------------------------------- #
         if self.is_array:
@@ -914,29 +1055,31 @@ class ApiAttribute(object):
     # ----------------------------------------- Getters and Setters -- #
     def _get_message(self, plug):
         """return the node(s) which are connected to this message plug"""
+        # the recursive calls already return ApiAttributes or ApiNodes, so
+        # their results are collected as they are
+        get_message = self._get_message
         if plug.isArray():
-            all_elements = []
-            for i in range(plug.numElements()):
-                element_plug = plug.elementByLogicalIndex(i)
-                msg_plug = self._get_message(element_plug)
-                all_elements.append(ApiAttribute(msg_plug))
-            return all_elements
+            element_by_index = plug.elementByLogicalIndex
+            return [get_message(element_by_index(i))
+                    for i in xrange(plug.numElements())]
         elif plug.isCompound():
-            all_plugs = []
-            for i in range(plug.numChildren()):
-                # recursive call
-                child_plug = om.MPlug(plug.child(i))
-                all_plugs.append(ApiAttribute(self._get_message(child_plug)))
-            return [ApiAttribute(plg) for plg in all_plugs]
+            child = plug.child
+            return [get_message(om.MPlug(child(i)))
+                    for i in xrange(plug.numChildren())]
         elif plug.isDestination():
             _mplug_array_clear()
             plug.connectedTo(_mplug_array, True, False)
             return ApiAttribute(om.MPlug(_mplug_array[0]))
-        elif '.message' in self.full_name:
+        elif self._is_message_attr:
             return ApiNode.from_mobject(om.MObject(plug.node()))
         else:
             return None
 
+    @cached_property
+    def _is_message_attr(self):
+        # checked once per leaf of every message read; the name is fixed
+        return '.message' in self.full_name
+
     def _set_message(self, plug, api_node):
         """assigns the message plug of the given api_node to the given
         attribute
@@ -948,7 +1091,8 @@ class ApiAttribute(object):
         if self.is_array:
             plug = plug.elementByLogicalIndex(0)
         matrix = om.MFnMatrixData(plug.asMObject()).matrix()
-        return [[matrix(i, j) for i in range(4)] for j in range(4)]
+        return [[matrix(i, j) for i, j in column]
+                for column in self._matrix_cells]
 
     def _get_angle(self, plug):
         m_angle_obj = plug.asMAngle()
@@ -1023,7 +1167,13 @@ class ApiAttribute(object):
         return '<ApiAttribute {0}>'.format(self.full_name)
 
     def __hash__(self):
-        return hash('{}{}'.format(self.api_node.uuid, self.full_name))
+        return self._hash
+
+    @cached_property
+    def _hash(self):
+        # the uuid and full name are fixed for the life of the instance,
+        # so the hash is built once, on first use, rather than in __init__
+        return hash((self.api_node.uuid, self.full_name))
 
     def __getitem__(self, item):
         """dictionary-style lookup treats array and compound attributes
@@ -1055,20 +1205,83 @@ class ApiAttribute(object):
 # -------------------------------------------------------- Modifier Stack -- #
 @contextmanager
 def dg_modifier():
+    # inside batch_connections(), the shared modifier is handed out and
+    # only run when the batch ends
+    if _batch_modifier is not None:
+        yield _batch_modifier
+        return
     modifier = om.MDGModifier()
     yield modifier
     modifier.doIt()
 
+@contextmanager
+def batch_connections():
+    """queue every change made through dg_modifier() (connections,
+    disconnections, attribute deletion) on one MDGModifier, and run it
+    once when the block exits, instead of once per change.  Queued changes
+    aren't visible inside the block: connecting twice to the same
+    destination within a batch will fail when the batch runs.  Nested
+    blocks join the outermost batch"""
+    global _batch_modifier
+    if _batch_modifier is not None:
+        yield _batch_modifier
+        return
+    modifier = _batch_modifier = om.MDGModifier()
+    try:
+        yield modifier
+    finally:
+        _batch_modifier = None
+    modifier.doIt()
+    _clear_value_cache()
+
 @contextmanager
 def dag_modifier():
     modifier = om.MDagModifier()
     yield modifier
     modifier.doIt()
 
+# -------------------------------------------------------- Value Memoizing -- #
+@contextmanager
+def memoized_values():
+    """cache leaf attribute values read through ApiAttribute.value, and
+    the parents found by parent_of (and so ancestors_of), for the
+    duration of the block.  Values set or connected through this module
+    clear the value cache, and nodes reparented through ApiNode.parent
+    clear both; anything else that changes the scene inside the block
+    (cmds, evaluation of a new frame) is not seen.
+    Nested blocks share the outermost caches.
+
+    Only numbers and strings are cached; anything else is read fresh
+    every time.  Every lookup costs a node handle and its hash code, so a
+    plug that is only read once is slower inside the block than outside
+    it"""
+    global _value_cache, _parent_cache
+    if _value_cache is not None:
+        yield
+        return
+    _value_cache = dict()
+    _parent_cache = dict()
+    try:
+        yield
+    finally:
+        _value_cache = None
+        _parent_cache = None
+
+def _clear_value_cache():
+    """forget memoized values, if a memoized_values() block is active"""
+    if _value_cache is not None:
+        _value_cache.clear()
+
+def _clear_parent_cache():
+    """forget memoized parents, if a memoized_values() block is active"""
+    if _parent_cache is not None:
+        _parent_cache.clear()
+
 # ----------------------------------------------------- Attribute control -- #
 def make_connection(source_plug, dest_plug, force=True):
     """connect a source plug to a destination plug, with an option to
     force the connection if one already exists"""
+    _clear_value_cache()
     with dg_modifier() as modifier:
         plug_connected = dest_plug.isDestination()
         if force and plug_connected:
@@ -1080,6 +1293,7 @@ def make_connection(source_plug, dest_plug, force=True):
 
 def break_all_connections(plug):
     """break all of the connections on a given plug"""
+    _clear_value_cache()
     if plug.isDestination():
         with dg_modifier() as modifier:
             source_plugs = om.MPlugArray()
@@ -1092,6 +1306,29 @@ def delete_attr(mobj, attr_as_mobj):
     with dg_modifier() as modifier:
         modifier.removeAttribute(mobj, attr_as_mobj)
 
+def _attr_mobj_of(fn_dg, type_name, attr):
+    """return the attribute MObject called attr, on the node the given
+    MFnDependencyNode is attached to, whose type is type_name.  Static
+    attributes are looked up once per node type, see _attr_mobj_cache.
+    Raises RuntimeError if the node has no such attribute"""
+    key = (type_name, attr)
+    attr_mobj = _attr_mobj_cache.get(key)
+    if attr_mobj is not None:
+        return attr_mobj
+    attr_mobj = fn_dg.attribute(attr)
+    if attr_mobj.isNull():
+        raise RuntimeError('no attribute called {0}'.format(attr))
+    # dynamic attributes belong to this node alone
+    _fn_attr_set_obj(attr_mobj)
+    if not _fn_attr.isDynamic():
+        _attr_mobj_cache[key] = attr_mobj
+    return attr_mobj
+
+def clear_attr_cache():
+    """forget every cached attribute MObject.  Call when a new scene is
+    opened, or plugin node types are reloaded"""
+    _attr_mobj_cache.clear()
+
 # ----------------------------------------------------- MObject Factories -- #
 def mobj_from_any(object_name_or_uuid):
     """Create an MObject if the provided argument isn't one already.
@@ -1157,7 +1394,7 @@ def msel_to_strings(msel):
 # ----------------------------------------------------------------- UUIDs -- #
 def is_uuid(uuid):
     """verify that the given string matches a potential uuid"""
-    return re.match(uuid_check, uuid)
+    return uuid_check.match(uuid)
 
 def uuid_from_mobj(mobj):
     """given an mobject, return the uuid"""
@@ -1217,12 +1454,27 @@ def hash_match(match_one, match_two):
 # ------------------------------------------------------------- Hierarchy -- #
 def parent_of(obj):
     """get the parent MObject from the given MObject"""
+    # overlapping ancestor chains only walk each parent once inside a
+    # memoized_values() block.  Hashes can collide, so a hit is confirmed
+    # against the child MObject it was stored for
+    cache = _parent_cache
+    if cache is not None:
+        key = maya_hash(obj)
+        try:
+            cached_obj, parent_mobj = cache[key]
+        except KeyError:
+            pass
+        else:
+            if cached_obj == obj:
+                return parent_mobj
     _fn_dag_set_obj(obj)
     if _fn_dag.parentCount() > 0:
         parent_mobj = _fn_dag.parent(0)
-        return parent_mobj
     else:
-        return None
+        parent_mobj = None
+    if cache is not None:
+        cache[key] = (obj, parent_mobj)
+    return parent_mobj
 
 def ancestors_of(obj, node_filter=[]):
     """get the ancestor MObjects of the MObject provided"""
@@ -1240,24 +1492,37 @@ def ancestors_of(obj, node_filter=[]):
     return parent_stack
 
 def shared_ancestors(objs):
-    """get the ancestors common to the MObjects provided"""
-    already_visited = set()
+    """get the ancestors common to all of the MObjects provided, nearest
+    first"""
+    # MObject wrappers of the same node don't compare as the same set
+    # member, so ancestors are matched on their hashes
+    objs = iter(objs)
+    try:
+        first = next(objs)
+    except StopIteration:
+        return []
+    shared = [(maya_hash(ancestor), ancestor)
+              for ancestor in ancestors_of(first)]
     for obj in objs:
-        ancestors = ancestors_of(obj, node_filter=already_visited)
-        already_visited.update(ancestors)
-    return list(already_visited)
+        if not shared:
+            break
+        hashes = set(maya_hash(ancestor) for ancestor in ancestors_of(obj))
+        shared = [pair for pair in shared if pair[0] in hashes]
+    return [ancestor for _, ancestor in shared]
 
 def children_of(obj):
     """get the children of the given MObject"""
     return list(iter_children(obj))
 
 def descendants_of(obj):
-    child_stack = [obj]
-    for child in child_stack:
-        children = children_of(child)
-        child_stack.extend(children)
-    # we don't want the original node
-    return child_stack[1:]
+    """get every descendant of the given MObject, breadth first"""
+    # the list is extended while it is walked, so every node's children
+    # are queued behind the current generation without a copy per node
+    descendants = list(iter_children(obj))
+    extend = descendants.extend
+    for child in descendants:
+        extend(iter_children(child))
+    return descendants
 
 def iter_children(obj):
     """"provide an iterator over the child objects of the given MObject"""
@@ -1347,9 +1612,8 @@ def is_group(transform):
 
 def _om_enum_to_dict(enum):
     """convert an OpenMaya enumerator to a dict"""
-    items = (reversed(item) for item in enum.__dict__.iteritems()
-             if item[0].startswith('k'))
-    return dict(items)
+    return dict((value, name) for name, value in enum.__dict__.iteritems()
+                if name.startswith('k'))
 
 def fn_type_dict():
     """return a dictionary representing every entry in the OpenMaya.MFn
@@ -16,6 +16,11 @@
 
 # -------------------------------------------------------------------------- #
 # --------------------------------------------------------------- IMPORTS -- #
+# built-in
+from functools import partial
+import threading
+import weakref
+
 # internal
 import LightingTools.general_utils.slog as slog
 from LightingTools.general_utils.debug import about_this_stack
@@ -26,7 +31,56 @@ VERSION = '1.0'
 DEBUG_VERSION = '1.0.1'
 
 logger = slog.Logger()
-cb_register = []
+
+# each thread keeps its own register, so threads creating callbacks never
+# share (and contend on) a single global container.  Every register is also
+# held in _all_registers, so callbacks outlive the thread that created them,
+# and all of them can be walked and cleared at shutdown.  Once its thread
+# has finished, a register is dropped as soon as it is empty
+_registers = threading.local()
+_all_registers = []
+_all_registers_lock = threading.Lock()
+
+# -------------------------------------------------------------------------- #
+# ------------------------------------------------------------- FUNCTIONS -- #
+def get_register():
+    """return the default callback register for the calling thread"""
+    try:
+        return _registers.register
+    except AttributeError:
+        register = _registers.register = set()
+        thread_ref = weakref.ref(threading.current_thread())
+        with _all_registers_lock:
+            _prune_registers()
+            _all_registers.append((thread_ref, register))
+        return register
+
+def _prune_registers():
+    """forget the empty registers of finished threads.  The caller must
+    hold _all_registers_lock"""
+    _all_registers[:] = [(thread_ref, register)
+                         for thread_ref, register in _all_registers
+                         if register or _thread_alive(thread_ref)]
+
+def _thread_alive(thread_ref):
+    thread = thread_ref()
+    return thread is not None and thread.is_alive()
+
+def all_registers():
+    """return every default register still in use, one per thread"""
+    with _all_registers_lock:
+        return [register for _, register in _all_registers]
+
+def clear_registers():
+    """unregister every callback held in a default register, from every
+    thread, allowing them to be garbage collected"""
+    for register in all_registers():
+        register.clear()
+    with _all_registers_lock:
+        _prune_registers()
+
+# the register of the importing thread, usually the main / UI thread
+cb_register = get_register()
 
 # -------------------------------------------------------------------------- #
 # --------------------------------------------------------------- CLASSES -- #
@@ -36,32 +90,42 @@ class Callback(object):
     (args and kwargs) meant to be passed into it when called.
     See the example code in this module for more detail
     """
-    def __init__(self, func, register=cb_register, *args, **kwargs):
+    def __init__(self, func, register=None, *args, **kwargs):
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        # partial merges call-time arguments with the bound ones in C, so
+        # the common no-bound-arguments case calls func directly
+        if args or kwargs:
+            self._bound = partial(func, *args, **kwargs)
+        else:
+            self._bound = func
         # in many UI applications, callbacks have a tendency to disappear
         # when they go out of scope.  By attaching the callback to this
         # module, or another memory location like a list, we can keep
         # its reference count up and prevent garbage collection.
         # on the other side, this also allows easy manual cleanup of
         # callbacks.
+        if register is None:
+            register = get_register()
         self.register = register
-        register.append(cb_register)
+        register.add(self)
 
     def __call__(self, *args, **kwargs):
         """positional arguments from the caller are appended, and keywords are
         updated. Be careful, because kwargs can be overridden on call!"""
-        final_args = self.args + args
-        final_kwargs = dict(self.kwargs)
-        final_kwargs.update(kwargs)
         try:
-            return self.func(*final_args, **self.kwargs)
+            return self._bound(*args, **kwargs)
         except:
             about_this_stack(strategy=logger.error)
             slog.error('Original Traceback:')
             raise
 
+    def unregister(self):
+        """remove this callback from its register, allowing it to be
+        garbage collected once nothing else references it"""
+        self.register.discard(self)
+
     def __repr__(self):
         return '<Callback for function: {0}>'.format(self.func.__name__)
 
@@ -72,7 +136,7 @@ def example():
     # let's say that example_func is a function we want to call later on
     # when triggered by a ui event.  We make a callback which
     # encapsulates the data we want to run:
-    cb = Callback(example_func, 'beep!')
+    cb = Callback(example_func, cb_register, 'beep!')
     # now, whenever the UI triggers whatever event specified, cb gets
     # called:
     cb()
@@ -19,6 +19,7 @@
 # built-in
 from __future__ import division
 from colorsys import hsv_to_rgb, rgb_to_hsv
+from itertools import starmap
 import operator
 
 # domain
@@ -35,28 +36,38 @@ palette = {}
 # -------------------------------------------------------------------------- #
 # --------------------------------------------------------------- CLASSES -- #
 class Color(object):
+    # derived values (_hsv, _hex, _lum, _css) are computed lazily and reset
+    # to None whenever the rgb value changes
+    __slots__ = ('_rgb', '_hsv', '_hex', '_lum', '_css', 'transform_gamma',
+                 'palette')
+
     def __init__(self, rgb=(0, 0, 0), name=None, palette=palette):
+        # slots are filled directly rather than through the rgb setter,
+        # there is nothing to invalidate on a new color
+        self._rgb = tuple(rgb)
+        self._hsv = self._hex = self._lum = self._css = None
         self.transform_gamma = 1
-        self.rgb = rgb
-        self._cache = {}
         self.palette = palette
         if name:
-            palette[name] = self
+            self.register(name, self, palette)
 
     # ----------------------------------------------------------- Methods -- #
 
     # ------------------- Mutations ---------------------------------------- #
     def clamp(self):
-        self.rgb = tuple([(max(min(ch, 1), 0)) for ch in self.rgb])
+        red, green, blue = self._rgb
+        self.rgb = (max(min(red, 1), 0), max(min(green, 1), 0),
+                    max(min(blue, 1), 0))
 
     def normalize(self):
-        max_val = max(self.rgb)
-        self.rgb = tuple([(ch / max_val) for ch in self.rgb])
+        red, green, blue = self._rgb
+        max_val = max(red, green, blue)
+        self.rgb = ((red / max_val), (green / max_val), (blue / max_val))
         self.clamp()
 
     # ------------------- Returns New Instances ---------------------------- #
     def clone(self):
-        return Color(self.rgb)
+        return Color(self._rgb)
 
     def tints(self, steps=8):
         return interpolate(self, WHITE, gamma=(1 / self.transform_gamma),
@@ -82,15 +93,19 @@ class Color(object):
     @rgb.setter
     def rgb(self, rgb):
         self._rgb = tuple(rgb)
-        self._cache = {}
+        self._hsv = self._hex = self._lum = self._css = None
 
     @property
     def rgb_css(self):
-        return 'rgb{}'.format(tuple(self.rgb_int))
+        if self._css is None:
+            self._css = 'rgb(%d, %d, %d)' % self.rgb_int
+        return self._css
 
     @property
     def hsv(self):
-        return self._cache.setdefault('hsv', rgb_to_hsv(*self.rgb))
+        if self._hsv is None:
+            self._hsv = rgb_to_hsv(*self._rgb)
+        return self._hsv
 
     @hsv.setter
     def hsv(self, hsv):
@@ -101,22 +116,24 @@ class Color(object):
         return self.hsv[0]
 
     @hue.setter
-    def hue(self, hue):
-        _, sat, val = self.hsv
-        self.hsv = (hue, sat, val)
+    def hue(self, hue, _hsv_to_rgb=hsv_to_rgb):
+        _, sat, val = self._hsv or rgb_to_hsv(*self._rgb)
+        self.rgb = _hsv_to_rgb(hue, sat, val)
 
     @property
     def saturation(self):
         return self.hsv[1]
 
     @saturation.setter
-    def saturation(self, sat):
-        hue, _, val = self.hsv
-        self.hsv = (hue, sat, val)
+    def saturation(self, sat, _hsv_to_rgb=hsv_to_rgb):
+        hue, _, val = self._hsv or rgb_to_hsv(*self._rgb)
+        self.rgb = _hsv_to_rgb(hue, sat, val)
 
     @property
     def hex(self):
-        return self._cache.setdefault('hex', rgb_to_hex(self.rgb))
+        if self._hex is None:
+            self._hex = rgb_to_hex(self._rgb)
+        return self._hex
 
     @hex.setter
     def hex(self, hexa):
@@ -124,29 +141,34 @@ class Color(object):
 
     @property
     def hex_css(self):
-        return '#{}'.format(self.hex)
+        return '#' + self.hex
 
     @property
     def luminance(self):
-        red, green, blue = self.rgb
-        red = 0.212656 * red
-        green = 0.715158 * green
-        blue = 0.0721856 * blue
-        return red + green + blue
+        if self._lum is None:
+            red, green, blue = self._rgb
+            red = 0.212656 * red
+            green = 0.715158 * green
+            blue = 0.0721856 * blue
+            self._lum = red + green + blue
+        return self._lum
 
     @property
     def tile_color(self):
         """convenience method for getting an integer appropriate for use
         with the tile colors in NUKE
         """
-        return int((self.hex + 'ff'), base=16)
+        return _pack_rgb(self._rgb) << 8 | 0xff
 
     # ------------------------------------------------------ Constructors -- #
+    @classmethod
+    def register(cls, name, color, palette=palette):
+        """add a color to a palette under the given name"""
+        palette[name] = color
+
     @classmethod
     def from_rgb_float(cls, rgb, name=None):
-        instance = cls(name=name)
-        instance.rgb = rgb
-        return instance
+        return cls(rgb, name=name)
 
     @classmethod
     def from_rgb_int(cls, rgb, name=None):
@@ -155,29 +177,44 @@ class Color(object):
 
     @classmethod
     def from_hsv(cls, hsv, name=None):
-        rgb = hsv_to_rgb(hsv)
+        rgb = hsv_to_rgb(*hsv)
         return cls.from_rgb_float(rgb, name)
 
+    @classmethod
+    def from_rgb_array(cls, rgb_array):
+        """batch constructor, returns a list of unnamed colors for a
+        sequence of rgb float triples"""
+        return [cls(rgb) for rgb in rgb_array]
+
+    @classmethod
+    def from_hsv_array(cls, hsv_array):
+        """batch constructor, returns a list of unnamed colors for a
+        sequence of hsv triples"""
+        return cls.from_rgb_array(hsv_array_to_rgb(hsv_array))
+
     @classmethod
     def from_hex(cls, hexa, name=None):
-        return cls.from_rgb_float(hex_to_rgb(hexa))
+        return cls.from_rgb_float(hex_to_rgb(hexa), name)
 
     # ------------------------------------------------------------- Magic -- #
     def __repr__(self):
-        return "<Color rgb({})>".format(self.rgb)
+        return '<Color rgb(%r)>' % (self._rgb,)
 
     # ------------------- Arithmetic --------------------------------------- #
     # all arithmetic operations are handled using RGB
 
     def _arithmetic(self, other, op):
-        try:
-            new_rgb = [op(ch1, ch2) for ch1, ch2 in zip(self, other)]
-        except TypeError:
+        # colors and 3-channel sequences are applied channel-by-channel,
+        # anything else is broadcast across all three channels
+        red, green, blue = self._rgb
+        if isinstance(other, Color):
+            o_red, o_green, o_blue = other._rgb
+        else:
             try:
-                new_rgb = [op(ch, other) for ch in self]
+                o_red, o_green, o_blue = other
             except TypeError:
-                raise
-        return Color(new_rgb)
+                o_red = o_green = o_blue = other
+        return Color((op(red, o_red), op(green, o_green), op(blue, o_blue)))
 
     def __add__(self, other):
         return self._arithmetic(other, operator.add)
@@ -199,7 +236,10 @@ class Color(object):
 
     # ------------------------------------------ Iteration And Membership -- #
     def __iter__(self):
-        return iter(self.rgb)
+        return iter(self._rgb)
+
+    def __len__(self):
+        return 3
 
 
 # --------------------------------------------------------- Global Colors -- #
@@ -220,48 +260,87 @@ MAGENTA = Color((1, 0, 1), 'MAGENTA')
 # ------------------------------------------------------------- FUNCTIONS -- #
 def interpolate(color_one, color_two, steps=8, via='rgb', gamma=1):
     # valid values for via are 'rgb' and 'hsv'
-    colors = [None] * steps
-    channels_one = getattr(color_one, via)
-    channels_two = getattr(color_two, via)
-    diff = [(ch2 - ch1) for ch1, ch2 in zip(channels_one, channels_two)]
+    return Color.from_rgb_array(interpolate_rgb(color_one, color_two,
+                                                steps, via, gamma))
+
+def interpolate_rgb(color_one, color_two, steps=8, via='rgb', gamma=1):
+    """same as interpolate, but returns plain rgb float triples instead of
+    Color instances.  Use this for large gradients (LUT bakes and the
+    like) where wrapping every step in a Color would dominate"""
+    # both end colors are always included, so fewer than two steps can't
+    # be honoured
+    if steps < 2:
+        raise ValueError('interpolation needs at least 2 steps, got '
+                         '{0}'.format(steps))
+    ch1_a, ch1_b, ch1_c = getattr(color_one, via)
+    ch2_a, ch2_b, ch2_c = getattr(color_two, via)
+    diff_a, diff_b, diff_c = (ch2_a - ch1_a), (ch2_b - ch1_b), (ch2_c - ch1_c)
     # this is not a valid use of gamma, really.  The "gamma" value ends up
     # being a bias towards one end of the range or another
-    gamma_lut = [((i / (steps - 1)) ** gamma) for i in range(steps)]
-    colors[0] = color_one.clone()
-    for i in range(1, (steps - 1)):
-        new_values = [channels_one[j] + (diff_ch * gamma_lut[i])
-                      for j, diff_ch, in zip(range(3), diff)]
-        next_color = Color()
-        setattr(next_color, via, new_values)
-        colors[i] = next_color
-    colors[-1] = color_two.clone()
-    return colors
+    last = steps - 1
+    if gamma == 1:
+        gamma_lut = (i / last for i in range(1, last))
+    else:
+        gamma_lut = ((i / last) ** gamma for i in range(1, last))
+    # the lut is consumed lazily, so every in-between value is built in a
+    # single pass, then the whole batch is converted back to rgb at once
+    grid = [(ch1_a + (diff_a * g), ch1_b + (diff_b * g), ch1_c + (diff_c * g))
+            for g in gamma_lut]
+    if via == 'hsv':
+        grid = hsv_array_to_rgb(grid)
+    rgb_values = [color_one.rgb]
+    rgb_values.extend(grid)
+    rgb_values.append(color_two.rgb)
+    return rgb_values
 
 
 # -- RGB Conversion -------------------------------------------------------- #
 def rgb_float_to_int(rgb):
-    return [int(ch * 255.999) for ch in rgb]
+    # saturate to 0-255, out-of-range floats would otherwise produce
+    # ints that can't be packed or formatted as hex
+    red, green, blue = rgb
+    return [min(max(int(red * 255.999), 0), 255),
+            min(max(int(green * 255.999), 0), 255),
+            min(max(int(blue * 255.999), 0), 255)]
 
 def rgb_int_to_float(rgb):
     return [(float(ch) / 255.0) for ch in rgb]
 
 
-# -- Hexadecimel Conversion ------------------------------------------------ #
-_NUMERALS = '0123456789abcdefABCDEF'
-_HEXDICT = {v: int(v, 16) for v in (x + y for x in _NUMERALS
-                                    for y in _NUMERALS)}
+# -- HSV Conversion -------------------------------------------------------- #
+# starmap keeps the per-color loop in C, leaving only the colorsys call
+def rgb_array_to_hsv(rgb_array):
+    return list(starmap(rgb_to_hsv, rgb_array))
+
+def hsv_array_to_rgb(hsv_array):
+    return list(starmap(hsv_to_rgb, hsv_array))
 
+
+# -- Hexadecimel Conversion ------------------------------------------------ #
 LOWERCASE, UPPERCASE = 'x', 'X'
+_HEX_FORMATS = {LOWERCASE: '06x', UPPERCASE: '06X'}
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
 
 def hex_to_rgb(hexa):
-    rgb = (_HEXDICT[hexa[0:2]],
-           _HEXDICT[hexa[2:4]],
-           _HEXDICT[hexa[4:6]])
-    return rgb_int_to_float(rgb)
+    # int() would also take short strings, a '0x' prefix and whitespace,
+    # so the digits are checked before the single parse
+    digits = hexa[0:6]
+    if len(digits) < 6 or not _HEX_DIGITS.issuperset(digits):
+        raise ValueError('{0!r} does not start with a six digit hex '
+                         'color'.format(hexa))
+    # the channels are then just shifted out
+    packed = int(digits, 16)
+    return [(packed >> 16) / 255.0,
+            ((packed >> 8) & 0xff) / 255.0,
+            (packed & 0xff) / 255.0]
 
 def rgb_to_hex(rgb, lettercase=LOWERCASE):
-    rgb = rgb_float_to_int(rgb)
-    return format(rgb[0] << 16 | rgb[1] << 8 | rgb[2], '06' + lettercase)
+    return format(_pack_rgb(rgb), _HEX_FORMATS[lettercase])
+
+def _pack_rgb(rgb):
+    """pack float rgb into a single 24-bit integer, 0xRRGGBB"""
+    red, green, blue = rgb_float_to_int(rgb)
+    return red << 16 | green << 8 | blue
 
 
 # -------------------------------------------------------------------------- #
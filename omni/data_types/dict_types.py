@@ -16,10 +16,13 @@
 # --------------------------------------------------------------- IMPORTS -- #
 
 # built-in
+from array import array
 from collections import defaultdict, OrderedDict
+from functools import reduce
+from operator import getitem
 
 # internal
-from LightingTools.general_utils.data_types import FlyWeight_Meta
+from .metaclasses import FlyWeight_Meta
 
 # -------------------------------------------------------------------------- #
 # --------------------------------------------------------------- GLOBALS -- #
@@ -30,15 +33,19 @@ DEBUG_VERSION = '1.0.4'
 
 __all__ = ['TreeNode', 'TreeDict', 'OrderedTreeDict', 'DefaultTree',
            'COLUMNS', 'MultiColumnTree', 'OrderedMultiColumnTree',
-           'allocated_dict']
+           'allocated_dict', 'columnar_dict']
 
 # -------------------------------------------------------------------------- #
 # --------------------------------------------------------------- CLASSES -- #
-class TreeNode(object):
+# the flyweight base is built by calling the metaclass directly, so that
+# instances are interned under both python 2 and python 3
+_FlyWeightBase = FlyWeight_Meta('_FlyWeightBase', (object,), {'__slots__': ()})
+
+class TreeNode(_FlyWeightBase):
     """A very basic object which can be used as a dictionary key with a
     minimum of overhead.  This allows unambiguous type-checking to make
     sure a dictionary key is ONLY a dictionary key. """
-    __metaclass__ = FlyWeight_Meta
+    __slots__ = ('type_', 'repr_')
 
     def __init__(self, type_='__node__', repr_='NODE'):
         super(TreeNode, self).__init__()
@@ -51,32 +58,30 @@ class TreeNode(object):
 class TreeDictBase(object):
     """simple autovivifying dictionary with some convenience methods for
     moving around data within the tree"""
-    def __init__(self, *args, **kwargs):
-        super(TreeDictBase, self).__init__(*args, **kwargs)
+    def __missing__(self, key):
+        # called by dict.__getitem__ only when the key is absent, so hits
+        # never leave C
+        dict_inst = type(self)()
+        self[key] = dict_inst
+        return dict_inst
 
-    def __getitem__(self, key):
-        if key in self:
-            return super(TreeDictBase, self).__getitem__(key)
-        else:
-            dict_inst = type(self)()
-            super(TreeDictBase, self).__setitem__(key, dict_inst)
-            return dict_inst
-
-    def get_at_path(self, split_path):
-        branch = self
-        for token in split_path:
-            branch = branch[token]
-        return branch
+    def get_at_path(self, split_path, _reduce=reduce, _getitem=getitem):
+        # reduce walks the path in C, autovivifying through __missing__
+        return _reduce(_getitem, split_path, self)
 
     def set_at_path(self, split_path, value):
-        branch = self.get_at_path(split_path[:-1])
-        branch[split_path[-1]] = value
+        self.get_at_path(split_path[:-1])[split_path[-1]] = value
 
     def pop_at_path(self, split_path):
         return self.get_at_path(split_path[:-1]).pop(split_path[-1])
 
     def repath(self, old_path, new_path):
-        self.set_at_path(new_path, self.pop_at_path(old_path))
+        if old_path[:-1] == new_path[:-1]:
+            # a rename within the same branch only needs one walk
+            branch = self.get_at_path(old_path[:-1])
+            branch[new_path[-1]] = branch.pop(old_path[-1])
+        else:
+            self.set_at_path(new_path, self.pop_at_path(old_path))
 
 class TreeDict(TreeDictBase, dict):
     """Autovivifying dictionary type"""
@@ -101,9 +106,6 @@ COLUMNS = TreeNode('__columns__', 'COLUMNS')
 class MultiColumnTreeBase(object):
     """Representation for tree types with multiple columns. Useful in
     UI creation and storage of tabular data"""
-    def __init__(self, *args, **kwargs):
-        super(MultiColumnTreeBase, self).__init__(*args, **kwargs)
-
     def set_columns_at_path(self, path, columns):
         """move a set of columns to the given path"""
         self.get_at_path(path)[COLUMNS] = columns
@@ -112,13 +114,11 @@ class MultiColumnTreeBase(object):
         columns = self.get_at_path(path).setdefault(COLUMNS, [])
         columns.append(column)
 
-class MultiColumnTree(MultiColumnTreeBase, OrderedTreeDict):
-    def __init__(self, *args, **kwargs):
-        super(MultiColumnTree, self).__init__(*args, **kwargs)
+class MultiColumnTree(MultiColumnTreeBase, TreeDict):
+    """Multi-column tree built on the unordered TreeDict"""
 
 class OrderedMultiColumnTree(MultiColumnTreeBase, OrderedTreeDict):
-    def __init__(self, *args, **kwargs):
-        super(OrderedMultiColumnTree, self).__init__(*args, **kwargs)
+    """Multi-column tree which preserves insertion order"""
 
 
 # ----------------------------------------------------- DefaultDict types -- #
@@ -139,6 +139,13 @@ def allocated_dict(length):
         return list(_pre)
     return defaultdict(preallocated)
 
+def columnar_dict(length, typecodes):
+    """a dictionary of pre-allocated, zero-filled array.array columns, one
+    per key of typecodes (a mapping of column name to array typecode).
+    numeric tables stored this way avoid a boxed python object per cell"""
+    return {name: array(typecode, [0]) * length
+            for name, typecode in typecodes.items()}
+
 # -------------------------------------------------------------------------- #
 # ---------------------------------------------------------- EXAMPLE CODE -- #
 def example():
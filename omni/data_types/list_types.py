@@ -12,6 +12,12 @@
 @notes: WIP
 
 """
+# -------------------------------------------------------------------------- #
+# --------------------------------------------------------------- IMPORTS -- #
+
+# built-in
+from array import array
+
 # -------------------------------------------------------------------------- #
 # --------------------------------------------------------------- GLOBALS -- #
 
@@ -19,6 +25,8 @@
 VERSION = '1.1'
 DEBUG_VERSION = '1.0.4'
 
+__all__ = ['allocated_list', 'allocated_array', 'RingBuffer']
+
 
 # -------------------------------------------------------------------------- #
 # ------------------------------------------------------------- FUNCTIONS -- #
@@ -26,3 +34,45 @@ def allocated_list(length):
     """there are some situations where a pre-allocated list of specified
     size is much faster than appending to a list multiple times."""
     return [None] * length
+
+def allocated_array(length, typecode='d'):
+    """a pre-allocated, zero-filled array.array of the given typecode.
+    numeric data is stored unboxed, so this is much smaller than an
+    allocated_list of floats or ints."""
+    return array(typecode, [0]) * length
+
+# -------------------------------------------------------------------------- #
+# --------------------------------------------------------------- CLASSES -- #
+class RingBuffer(object):
+    """a fixed-size buffer which keeps the most recent maxlen items, like
+    a deque with a maxlen.  Storage is allocated once, up front, so
+    appending never allocates; once full, each append overwrites the
+    oldest item."""
+    __slots__ = ('maxlen', '_buf', '_head', '_count')
+
+    def __init__(self, maxlen):
+        self.maxlen = maxlen
+        self._buf = allocated_list(maxlen)
+        self._head = 0
+        self._count = 0
+
+    def append(self, item):
+        maxlen = self.maxlen
+        count = self._count
+        if count < maxlen:
+            # until the buffer fills up, the head never moves
+            self._buf[count] = item
+            self._count = count + 1
+        elif maxlen:
+            head = self._head
+            self._buf[head] = item
+            self._head = (head + 1) % maxlen
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        head = self._head
+        if not head:
+            return iter(self._buf[:self._count])
+        return iter(self._buf[head:] + self._buf[:head])
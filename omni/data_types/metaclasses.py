@@ -37,4 +37,9 @@ class FlyWeight_Meta(type):
     def __call__(cls, *args, **kwargs):
         lookup = (args, tuple(kwargs.items()))
         cache = cls.__inst_cache
-        return cache.setdefault(lookup, type.__call__(cls, *args, **kwargs))
+        try:
+            return cache[lookup]
+        except KeyError:
+            # only build a new instance on a cache miss
+            instance = cache[lookup] = type.__call__(cls, *args, **kwargs)
+            return instance
@@ -26,79 +26,79 @@ class cached_property(object):
     DESCRIPTOR:
     Allows lazy evaluation of properties.  Uses the same interface as
     regular properties, but only supports the instance.setter method,
-    not instance.deleter
+    not instance.deleter.  The value is cached in the instance __dict__
+    under the property's own name.  As with a regular property, a custom
+    setter sets the new value by assigning to self.<name>; see obj_proxy.
+
+    Without a custom setter this is a non-data descriptor, so once the
+    value is cached, the instance __dict__ answers every lookup and
+    __get__ is never called again.  Setting and deleting act on the
+    cache directly.
     """
-    class obj_proxy(object):
-        """provides an intermediary object where an attribute can be set
-        from inside a property without recursion. Should only be used as
-        part of the cached_property class"""
-        def __init__(self, attr_name, cacheattr):
-            self.__dict__['_cacheattr_'] = cacheattr
-            self.__dict__['_attr_name_'] = attr_name
-
-        def __getattr__(self, attr):
-            if attr == self._attr_name_:
-                return getattr(self._obj_, self._cacheattr_)
-            else:
-                return getattr(self._obj_, attr)
-
-        def __setattr__(self, attr, value):
-            if attr == self._attr_name_:
-                setattr(self._obj_, self._cacheattr_, value)
-            else:
-                setattr(self._obj_, attr, value)
-
-        def __call__(self, obj):
-            """because the calling class instance doesn't exist when the
-            cached_property is created (during decoration), we need to
-            pass in the obj here."""
-            self.__dict__['_obj_'] = obj
-            return self
-
     def __init__(self, get_func):
         self.__doc__ = getattr(get_func, '__doc__')
         self.fget = get_func
-        # "attr_name" becomes "_attr_name"
         self.attr_name = get_func.__name__
-        self.cacheattr = '__'.join(('', self.__class__.__name__,
-                                   self.attr_name))
-        self.proxy = self.obj_proxy(self.attr_name, self.cacheattr)
+        self.fset = None
 
     def __get__(self, obj, cls):
         if obj is None:
             return self
+        value = obj.__dict__[self.attr_name] = self.fget(obj)
+        return value
+
+    def setter(self, set_func):
+        return _cached_property_with_setter(self.fget, set_func)
+
+class obj_proxy(object):
+    """stands in for the instance inside a custom cached_property setter,
+    so the setter can assign to its own property without recursion.
+    Assigning to the property's name sets the cached value; every other
+    attribute is read from and set on the instance.  A new proxy is made
+    for every assignment"""
+    __slots__ = ('_obj_', '_attr_name_')
+
+    def __init__(self, obj, attr_name):
+        object.__setattr__(self, '_obj_', obj)
+        object.__setattr__(self, '_attr_name_', attr_name)
+
+    def __getattr__(self, attr):
+        return getattr(self._obj_, attr)
+
+    def __setattr__(self, attr, value):
+        if attr == self._attr_name_:
+            self._obj_.__dict__[attr] = value
         else:
-            try:
-                value = getattr(obj, self.cacheattr)
-            except AttributeError:
-                setattr(obj, self.cacheattr, self.fget(obj))
-                value = getattr(obj, self.cacheattr)
+            setattr(self._obj_, attr, value)
+
+class _cached_property_with_setter(cached_property):
+    """a cached_property with a custom setter.  Assignment has to pass
+    through the setter, so this is a data descriptor, and reads check
+    the cache themselves."""
+    def __init__(self, get_func, set_func):
+        super(_cached_property_with_setter, self).__init__(get_func)
+        self.fset = set_func
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        cache = obj.__dict__
+        try:
+            return cache[self.attr_name]
+        except KeyError:
+            value = cache[self.attr_name] = self.fget(obj)
             return value
 
     def __set__(self, obj, value):
-        self.proxy.__dict__.setdefault('_obj_', obj)
-        try:
-            self.fset(self.proxy, value)
-        except TypeError:
-            raise
-            raise AttributeError('attr {0} cannot be set'
-                                 ''.format(self.attr_name))
+        self.fset(obj_proxy(obj, self.attr_name), value)
 
     def __delete__(self, obj):
         try:
-            delattr(obj, self.cacheattr)
-        except AttributeError:
+            del obj.__dict__[self.attr_name]
+        except KeyError:
             raise AttributeError('attribute {0} has not been cached yet'
                                  ''.format(self.attr_name))
 
-    def fset(self, obj, value):
-        """fset default just sets the passed value to the cached attribute"""
-        setattr(obj, self.cacheattr, value)
-
-    def setter(self, set_func):
-        self.fset = set_func
-        return self
-
 # -------------------------------------------------------------------------- #
 # ---------------------------------------------------------- EXAMPLE CODE -- #
 def example():
@@ -125,12 +125,11 @@ class ExampleCachedPropertyClass(object):
     @a.setter
     def a(self, value):
         """this should allow us to directly set the cached value"""
-        # the cached_property'ss magic translates self into:
-        # cached_property.proxy._obj_
-        # so here, self.b actually looks up a.proxy._obj_.b
+        # the cached_property's magic translates self into an obj_proxy,
+        # so here, self.b actually looks up the instance's b
         print self.b
-        # and, because this is the attribute we have cached, it looks up
-        # a.proxy._obj_._cache['_a']
+        # and, because this is the attribute we have cached, assigning to
+        # it sets the cached value instead of calling this setter again
         self.a += value
 
     @cached_property
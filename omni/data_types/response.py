@@ -26,9 +26,12 @@ class BoolResponse(object):
     """A very basic response which is evaluated like a boolean. In practice,
     this is a convenient wrapper to other kinds of objects so that they can
     have a True/False evaluator"""
+    __slots__ = ('bool', 'payload')
+
     def __init__(self, boolean, payload=None):
         # -- Set up Instance Attributes ------------------------------ #
-        self.bool = boolean
+        # coerced once here, so truth-testing the response is trivial
+        self.bool = bool(boolean)
         # payload is an optional argument which allows data to be passed
         # from the response object
         self.payload = payload
@@ -39,15 +42,19 @@ class BoolResponse(object):
     def __str__(self):
         return str(self.bool)
 
-    def __nonzero__(self):
+    def __bool__(self):
         return self.bool
 
+    __nonzero__ = __bool__
+
     def __eq__(self, other):
         return self is other or self.bool == other
 
 
 class BoolMessage(BoolResponse):
     """Adds a message attribute to the basic boolean response"""
+    __slots__ = ('message',)
+
     def __init__(self, boolean, message=None, payload=None):
         super(BoolMessage, self).__init__(boolean, payload)
         # -- Validate Message ---------------------------------------- #
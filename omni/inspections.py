@@ -163,26 +163,18 @@ def get_mod_trace(frame):
     function is used in the slog module for blazing-fast Logger lookup.
     See slog for more details.
     """
-    _frame = frame
-    # this is the number of returned values per-frame.  It corresponds
-    # to the enumeration created above, and only includes the first
-    # three entries.
-    # ------------------- Determine Stack Depth ---------------------------- #
-    frame_count = 0
-    while _frame:
-        frame_count += 1
-        _frame = _frame.f_back
-    mods = [None] * frame_count
-    # ------------------- Build Info List ---------------------------------- #
-    i = 0
-    while frame:
-        # ------------------- Frame & Code Obj Attributes ------------------ #
-        try:
-            mods[i] = frame.f_globals['__name__']
-        except:
-            pass
-        # ------------------- Continue Loop -------------------------------- #
-        i += 1
+    # a single pass over f_back is all we need.  Consecutive frames from
+    # the same module are collapsed, which keeps the trace short and
+    # lets slog cache one entry per call site regardless of how deep
+    # (or how recursive) the code inside each module happens to be.
+    mods = []
+    mods_append = mods.append
+    last = None
+    while frame is not None:
+        mod_name = frame.f_globals.get('__name__')
+        if mod_name is not None and mod_name != last:
+            mods_append(mod_name)
+            last = mod_name
         frame = frame.f_back
     return mods
 
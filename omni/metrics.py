@@ -48,6 +48,8 @@ metric_logger = slog.Logger('__metrics__')
 metric_logger.standalone = True
 log_handler = slog.FileLogHandler()
 log_handler.always_evaluate = True
+# metrics are written in the background, but never lost at exit
+log_handler.join_main = True
 metric_logger.add_handler(log_handler)
 
 # -- Regular Logging ------------------------------------------------------- #
@@ -21,7 +21,11 @@ frame-lookup mechanism, which allows for automatic inheritance of loggers.
 # --------------------------------------------------------------- IMPORTS -- #
 
 # built-in
+import atexit
+import weakref
 import threading
+import time
+import struct
 import sys
 from itertools import chain
 from Queue import Queue
@@ -30,6 +34,7 @@ from collections import deque
 
 # internal
 from vfx_utils.omni.inspections import get_mod_trace
+from vfx_utils.omni.data_types.list_types import RingBuffer
 from vfx_utils.system_utils.directories import safe_make_dir
 
 # -------------------------------------------------------------------------- #
@@ -46,9 +51,12 @@ root_logger = None
 
 # ------------------------------------------------------------- Threading -- #
 # ------------------- Locks ------------------------------------------------ #
-handler_lock = threading.Lock()
-handler_ctx_lock = threading.Lock()
-root_lock = threading.Lock()
+# log calls are not serialized: the handler lists are only ever swapped
+# wholesale, which is atomic, and handlers are responsible for their own
+# thread safety (FileLogHandler hands off through a queue, for instance)
+root_lock = threading.RLock()
+# only taken when a Logger is first created; lookups never wait on it
+_logger_create_lock = threading.RLock()
 
 # -------------------------------------------------------- Logging Levels -- #
 # don't handle any slog commands
@@ -79,13 +87,141 @@ LEVEL_LOOKUP = {-1: 'LOG',
 # by default, only handle info, warnings, and errors
 DEFAULT_VERBOSITY = 3
 
+# level ceiling for loggers whose messages can't be filtered out up front
+_NO_CEILING = float('inf')
+
+# --------------------------------------------------- File Queue Overflow -- #
+# what a FileLogHandler does when its file's queue is full: wait for the
+# writer thread to make room, or throw away the oldest queued message
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+
 # -------------------------------------------------------------------------- #
 # --------------------------------------------------------------- LOGGERS -- #
 
 # ----------------------------------------------------------------- Cache -- #
-_logger_cache = {}
+# loggers are only cached for as long as something else (usually a module
+# global) holds on to them, so short-lived loggers don't pile up.  Loggers
+# which have been given handlers or configuration are pinned, since those
+# can't simply be recreated on the next lookup.
+_logger_cache = weakref.WeakValueDictionary()
+_pinned_loggers = {}
+# the most recently created loggers are also held strongly, so a one-off
+# Logger('name').info(...) at a call site doesn't recreate its logger (and
+# refresh every cached trace and ceiling) on each call
+_RECENT_LOGGER_COUNT = 64
+_recent_loggers = deque(maxlen=_RECENT_LOGGER_COUNT)
+
+# enclosing loggers for each module trace seen by broadcast.  Cleared
+# whenever a logger is added, swapped in as root, or toggles standalone.
+# keys carry _handler_version, for the same reason as _superhandler_cache
+_superlogger_cache = {}
+_SUPERLOGGER_CACHE_SIZE = 4096
+
+# flattened (handlers, bypass_handlers) for each logger and module trace,
+# along with the (level, level_exclusive) the logger filters on from there.
+# keys carry _handler_version, so a broadcast which races an invalidation
+# can only ever store its result under a version nobody will ask for again
+_superhandler_cache = {}
+_handler_version = 0
+
+def _invalidate_superhandlers():
+    """forget all flattened handler lists and resolved levels.  Called
+    whenever any logger's handlers or level settings change, or the set of
+    enclosing loggers might have changed"""
+    global _handler_version
+    _handler_version += 1
+    _superhandler_cache.clear()
+
+def _invalidate_superloggers():
+    """forget all module trace resolutions, and the handler lists built
+    from them"""
+    _superlogger_cache.clear()
+    _invalidate_superhandlers()
+
+def _resolve_superloggers(supermodules, is_main):
+    """return the non-standalone loggers belonging to the given module
+    trace, innermost first, with __main__ always included"""
+    if not is_main:
+        supermodules += ('__main__',)
+    # because multiple frames will live in the same modules, we need
+    # to condense the list down to unique items.
+    visited = set()
+    visited_add = visited.add
+    supermodules = [sm for sm in supermodules if sm not in visited
+                    and not visited_add(sm)]
+    # get the loggers associated with the modules, if any
+    cache_get = _logger_cache.get
+    superloggers_all = [sl for sl in [cache_get(sm) for sm in supermodules]
+                        if sl is not None]
+    # we only want to handle non-standalone loggers
+    return [sl for sl in superloggers_all if not sl._standalone]
+
+def _unique_handlers(handlers):
+    """return the given handlers as a tuple, dropping repeats.  Handlers
+    are compared by identity, so they need not be hashable, and two
+    handlers which happen to compare equal are both kept"""
+    seen = set()
+    seen_add = seen.add
+    unique = []
+    unique_append = unique.append
+    for handler in handlers:
+        handler_id = id(handler)
+        if handler_id not in seen:
+            seen_add(handler_id)
+            unique_append(handler)
+    return tuple(unique)
+
+def _resolve_superhandlers(logger, superloggers):
+    """return the de-duplicated handlers and bypass handlers of the
+    given superloggers, as a pair of tuples"""
+    bypass_handlers = chain.from_iterable([sl.bypass_handlers
+                                           for sl in superloggers])
+    if superloggers:
+        superhandlers = chain.from_iterable([sl.handlers
+                                             for sl in superloggers])
+    else:
+        superhandlers = logger.handlers
+    return (_unique_handlers(superhandlers),
+            _unique_handlers(bypass_handlers))
+
+def _accepting_handlers(handlers, level):
+    """return the handlers which will act on a message of the given level.
+    Plain callables are assumed to want every message"""
+    accepting = []
+    for handler in handlers:
+        if isinstance(handler, Handler) and not handler.always_evaluate:
+            if handler.level_exclusive:
+                if level != handler.level:
+                    continue
+            elif level > handler.level:
+                continue
+        accepting.append(handler)
+    return accepting
+
+def _level_state():
+    """return whether any non-standalone logger has always-evaluate
+    handlers, the levels of all loggers which override their submodules'
+    levels, and whether any non-standalone logger has handlers at all"""
+    active = [lg for lg in _logger_cache.values() if not lg._standalone]
+    has_bypass = any(lg.bypass_handlers for lg in active)
+    override_levels = [lg._level for lg in active
+                       if lg._overrides_submodule_level]
+    has_handlers = has_bypass or any(lg.handlers for lg in active)
+    return has_bypass, override_levels, has_handlers
+
+def _refresh_level_ceilings():
+    """recompute the level ceiling of every cached logger.  Called whenever
+    any logger's level configuration or always-evaluate handlers change"""
+    state = _level_state()
+    for logger in _logger_cache.values():
+        logger._level_ceiling = logger._resolve_level_ceiling(*state)
 
 # ----------------------------------------------------------- Metaclasses -- #
+# module names resolved for argument-less Logger() calls, by the code of
+# call sites outside slog
+_name_by_code = {}
+
 class LogLookup_Meta(type):
     """Implements the flyweight pattern for Loggers, keeping an instance
     dictionary in the Logger class for lookups.  This inherently makes
@@ -99,20 +235,43 @@ class LogLookup_Meta(type):
 
     def __call__(cls, *args, **kwargs):
         if not args:
+            outer_frame = sys._getframe(1)
+            # a call site outside slog always resolves to its own module,
+            # so its name is looked up once per code object
+            code = outer_frame.f_code
             try:
-                outer_frame = sys._getframe(1)
+                mod_name = _name_by_code[code]
+            except KeyError:
                 mod_name = outer_frame.f_globals['__name__']
+                if mod_name != __name__:
+                    _name_by_code[code] = mod_name
+                # calls from slog itself depend on who called into slog,
+                # so they are resolved by walking the stack every time
                 while mod_name == __name__:
                     outer_frame = outer_frame.f_back
                     try:
                         mod_name = outer_frame.f_globals['__name__']
                     except KeyError:
                         mod_name = '__main__'
+            args = (mod_name,)
+        try:
+            return _logger_cache[args[0]]
+        except KeyError:
+            pass
+        # double-checked: another thread may have created the logger while
+        # we waited for the lock, and there must only ever be one
+        with _logger_create_lock:
+            try:
+                return _logger_cache[args[0]]
             except KeyError:
-                raise
-            else:
-                args = (mod_name,)
-        return _logger_cache.setdefault(args[0], type.__call__(cls, *args, **kwargs))
+                logger = _logger_cache[args[0]] = type.__call__(cls, *args,
+                                                                **kwargs)
+                _recent_loggers.append(logger)
+            # other loggers may be borrowing this logger's level, and the
+            # cached module traces don't know about it yet
+            _invalidate_superloggers()
+            _refresh_level_ceilings()
+            return logger
 
 # --------------------------------------------------------------- Classes -- #
 class Logger(object):
@@ -151,7 +310,10 @@ class Logger(object):
     Ideally, Logger configuration should be set-and-forget, because a
     single logger instance might be called from multiple threads.
     Best-practice is to only create loggers at the module level or when
-    you can control instance creation on-the-fly.
+    you can control instance creation on-the-fly.  The logger cache only
+    holds unconfigured loggers weakly, so throwaway lookups don't
+    accumulate; a logger is kept for good once it is given a handler or
+    any of its settings change.
 
        NESTED LOGGING:
     Loggers which do not provide an explicit lookup are automatically
@@ -193,30 +355,34 @@ class Logger(object):
         # attributes should never be changed.
         self.name = name
         self.lookup = name
-        self._handlers = dict()
         self.handlers = []
-        self._bypass_handlers = dict()
         self.bypass_handlers = []
+        self._handler_ids = set()
+        self._ctx_lock = threading.RLock()
 
         # ------------------- Instance Modifications are Okay -------------- #
         # These are the attributes which the caller can edit after
-        # instance creation.
+        # instance creation.  Anything that affects level filtering is a
+        # property (see below), so that the level ceilings stay current.
         # standalone Loggers do not call the loggers in their enclosing scopes
-        self.standalone = False
+        self._standalone = False
         # the level determines which log messages trigger handlers
-        self.level = DEFAULT_VERBOSITY
+        self._level = DEFAULT_VERBOSITY
         # if the submodule has their own logger, we can choose to override
         # that level with this one.  Subsequently, only the outermost scope
         # with overrides_submodule_level == True will enforce their level
-        self.overrides_submodule_level = False
+        self._overrides_submodule_level = False
         # we can also explicitly use the level attribute of another Logger
-        self.borrow_level_from = None
+        self._borrow_level_from = None
+        # messages more verbose than the ceiling can never reach a handler,
+        # so the log methods drop them before doing any other work
+        self._level_ceiling = self._resolve_level_ceiling(*_level_state())
         # by default, all handlers above a given level are triggered. We can
         # also make this logger only execute on one specific level
-        self.level_exclusive = False
+        self._level_exclusive = False
         # formatters determine how messages are processed before being passed
         # to handlers
-        self.formatter = None
+        self._formatter = None
 
     # ----------------------------------------------------- Configuration -- #
     def config(self, level=DEFAULT_VERBOSITY, overrides_submodule_level=False,
@@ -234,56 +400,158 @@ class Logger(object):
         if formatter:
             self.formatter = formatter
 
+    # ----------------------------------------------- Level Filtering -- #
+    # level settings are read by broadcast without taking a lock.  each
+    # setter is a single attribute assignment, which is atomic under the
+    # GIL, followed by dropping every level resolved from the old value.
+    @property
+    def level(self):
+        return self._level
+
+    @level.setter
+    def level(self, level):
+        self._level = level
+        _invalidate_superhandlers()
+        _refresh_level_ceilings()
+        self._pin()
+
+    @property
+    def standalone(self):
+        return self._standalone
+
+    @standalone.setter
+    def standalone(self, standalone):
+        self._standalone = standalone
+        _invalidate_superloggers()
+        _refresh_level_ceilings()
+        self._pin()
+
+    @property
+    def overrides_submodule_level(self):
+        return self._overrides_submodule_level
+
+    @overrides_submodule_level.setter
+    def overrides_submodule_level(self, overrides):
+        self._overrides_submodule_level = overrides
+        _invalidate_superhandlers()
+        _refresh_level_ceilings()
+        self._pin()
+
+    @property
+    def borrow_level_from(self):
+        return self._borrow_level_from
+
+    @borrow_level_from.setter
+    def borrow_level_from(self, lookup):
+        self._borrow_level_from = lookup
+        _invalidate_superhandlers()
+        _refresh_level_ceilings()
+        self._pin()
+
+    @property
+    def level_exclusive(self):
+        return self._level_exclusive
+
+    @level_exclusive.setter
+    def level_exclusive(self, level_exclusive):
+        self._level_exclusive = level_exclusive
+        _invalidate_superhandlers()
+        self._pin()
+
+    @property
+    def formatter(self):
+        return self._formatter
+
+    @formatter.setter
+    def formatter(self, formatter):
+        self._formatter = formatter
+        self._pin()
+
+    def _pin(self):
+        """keep this logger alive for the rest of the session.  Loggers are
+        only weakly cached, so once a logger has been configured, it is
+        pinned, and its configuration can't be lost with it"""
+        _pinned_loggers[self.lookup] = self
+
+    def _resolve_level_ceiling(self, has_bypass, override_levels,
+                               has_handlers):
+        """return the most verbose level which could get past this
+        logger's level filter in broadcast, wherever it is called from."""
+        # with no handlers to reach, every level is disabled.  A standalone
+        # logger only ever reaches its own handlers
+        if self._standalone:
+            if self.handlers or self.bypass_handlers:
+                return _NO_CEILING
+            return -_NO_CEILING
+        if not has_handlers:
+            return -_NO_CEILING
+        # always-evaluate handlers have to see every message
+        if has_bypass:
+            return _NO_CEILING
+        if self._borrow_level_from:
+            try:
+                return _logger_cache[self._borrow_level_from]._level
+            except KeyError:
+                return self._level
+        # any enclosing logger could be the one overriding our level
+        return max([self._level] + override_levels)
+
     # ----------------------------------------------------- Handlers -- #
-    def add_handler(self, handler, _macro=False):
+    def add_handler(self, handler):
         """add a handler to the Logger instance"""
-        try:
-            handler.enter_handler()
-        except AttributeError:
-            pass
-        try:
-            always_eval = handler.always_evaluate
-        except AttributeError:
-            always_eval = False
-        if not always_eval:
-            self._handlers[id(handler)] = handler
-        else:
-            self._bypass_handlers[id(handler)] = handler
-        if not _macro:
-            self.handlers = self._handlers.values()
-            self.bypass_handlers = self._bypass_handlers.values()
+        self.add_handlers((handler,))
 
-    def remove_handler(self, handler, _macro=False):
+    def remove_handler(self, handler):
         """remove a handler from the logger instance"""
-        try:
-            handler.exit_handler()
-        except AttributeError:
-            pass
-        try:
-            always_eval = handler.always_evaluate
-        except AttributeError:
-            always_eval = False
-        if not always_eval:
-            self._handlers.pop(id(handler))
-        else:
-            self._bypass_handlers.pop(id(handler))
-        if not _macro:
-            self.handlers = self._handlers.values()
-            self.bypass_handlers = self._bypass_handlers.values()
+        self.remove_handlers((handler,))
 
     def add_handlers(self, handlers):
         """MACRO: add an iterable of handlers to the handler list"""
+        self._pin()
+        new_handlers = list(self.handlers)
+        new_bypass_handlers = list(self.bypass_handlers)
         for handler in handlers:
-            self.add_handler(handler, _macro=True)
-        self.handlers = self._handlers.values()
-        self.bypass_handlers = self._bypass_handlers.values()
+            try:
+                handler.enter_handler()
+            except AttributeError:
+                pass
+            if id(handler) in self._handler_ids:
+                continue
+            self._handler_ids.add(id(handler))
+            if getattr(handler, 'always_evaluate', False):
+                new_bypass_handlers.append(handler)
+            else:
+                new_handlers.append(handler)
+        self._set_handlers(new_handlers, new_bypass_handlers)
 
     def remove_handlers(self, handlers):
         """MACRO: remove an iterable of handlers from the handler list"""
-        for handler in handlers:
-            self.remove_handler(handler, _macro=True)
-        self.handlers = self._handlers.values()
-        self.bypass_handlers = self._bypass_handlers.values()
+        removed = set()
+        try:
+            for handler in handlers:
+                try:
+                    handler.exit_handler()
+                except AttributeError:
+                    pass
+                self._handler_ids.remove(id(handler))
+                removed.add(id(handler))
+        finally:
+            self._set_handlers(
+                [hd for hd in self.handlers if id(hd) not in removed],
+                [hd for hd in self.bypass_handlers if id(hd) not in removed])
+
+    def _set_handlers(self, handlers, bypass_handlers):
+        """swap in new handler lists.  The lists are replaced rather than
+        mutated, so a broadcast running in another thread always iterates
+        a consistent snapshot."""
+        bypass_changed = (len(bypass_handlers) != len(self.bypass_handlers))
+        emptied = (bool(self.handlers or self.bypass_handlers)
+                   != bool(handlers or bypass_handlers))
+        self.handlers = handlers
+        self.bypass_handlers = bypass_handlers
+        _invalidate_superhandlers()
+        if bypass_changed or emptied:
+            _refresh_level_ceilings()
 
     @contextmanager
     def use_handlers(self, handlers):
@@ -291,8 +559,9 @@ class Logger(object):
         logger with a different set, then return to the original handlers
         """
         # we are accessing shared data, so we lock this down until the original
-        # handler list is restored.
-        with handler_ctx_lock:
+        # handler list is restored.  The lock is per-logger and reentrant, so
+        # use_handlers blocks can be nested.
+        with self._ctx_lock:
             original_handlers = self.handlers
             for handler in handlers:
                 try:
@@ -300,6 +569,11 @@ class Logger(object):
                 except AttributeError:
                     pass
             self.handlers = handlers
+            _invalidate_superhandlers()
+            # going to or from no handlers at all can change the ceilings
+            emptied = bool(original_handlers) != bool(handlers)
+            if emptied:
+                _refresh_level_ceilings()
             yield
             for handler in handlers:
                 try:
@@ -307,6 +581,9 @@ class Logger(object):
                 except AttributeError:
                     pass
             self.handlers = original_handlers
+            _invalidate_superhandlers()
+            if emptied:
+                _refresh_level_ceilings()
 
     # ---------------------------------------------------- Broadcast -- #
     def broadcast(self, message, *args, **kwargs):
@@ -314,153 +591,182 @@ class Logger(object):
         and all of the loggers from modules which enclose this function.
         EX: if A and B both have loggers, and A imports B, when calling
         B.logger.log(), then both B.logger and A.logger handlers will
-        be called.
+        be called.  The level is passed as a keyword, level=<level>.
+        """
+        # this is the level of the message, i.e. Debug, Info, Error, etc.
+        level = kwargs.pop('level')
+        self._broadcast(message, level, args, kwargs, 3)
+
+    def _broadcast(self, message, level, args, kwargs, depth=2):
+        """the body of broadcast.  The log methods call this directly,
+        handing over their own args tuple and kwargs dict rather than
+        unpacking them into a fresh *args/**kwargs for every call.  depth
+        is the number of frames between here and the calling function.
 
         broadcast is handled as one really big function in order to
         reduce function-call overhead. We're trying to get every bit of
         performance out of this thing as possible.
         """
-        # this is the level of the message, i.e. Debug, Info, Error, etc.
-        level = kwargs.pop('level')
         # ------------------- Handle Standalone Loggers --------------- #
-        if self.standalone:
-            if args:
-                message = message.format(*args)
-            for handler in chain.from_iterable((self.handlers,
-                                                self.bypass_handlers)):
-                handler(message, level=level, **kwargs)
-            return
+        # standalone loggers are the rare case, so they're handled out of
+        # line, and checked on the raw attribute rather than the property
+        if self._standalone:
+            return self._broadcast_standalone(message, level, args, kwargs)
 
         # ------------------- Get Enclosing Module Loggers ------------ #
         # We need to get the frame of the calling function. The first
         # three frames should be:
-        # * frame 0: Logger.broadcast
+        # * frame 0: Logger._broadcast
         # * frame 1: Logger.info, debug, etc.
         # * frame 2: Calling function
-        frame = sys._getframe(2)
-        supermodules = get_mod_trace(frame)
-        is_main = (self.lookup == '__main__')
-        if not is_main:
-            supermodules.append('__main__')
-
-        # because multiple frames will live in the same modules, we need
-        # to condense the list down to unique items.
-        visited = set()
-        visited_add = visited.add
-        supermodules = [sm for sm in supermodules if sm not in visited
-                        and not visited_add(sm)]
-        # get the loggers associated with the modules, if any
-        superloggers_all = [_logger_cache[sm] for sm in supermodules
-                            if sm in _logger_cache]
-        # we only want to handle non-standalone loggers
-        superloggers = [sl for sl in superloggers_all if not sl.standalone]
+        frame = sys._getframe(depth)
+        # read the version before resolving anything, so that a concurrent
+        # invalidation leaves our results stranded under a stale key
+        version = _handler_version
+        # the same stack of modules always resolves to the same loggers,
+        # so the resolution is cached on the module trace itself
+        trace = tuple(get_mod_trace(frame))
+        is_main = self.lookup == '__main__'
+        key = (trace, is_main, version)
+        try:
+            superloggers = _superlogger_cache[key]
+        except KeyError:
+            if len(_superlogger_cache) >= _SUPERLOGGER_CACHE_SIZE:
+                _superlogger_cache.clear()
+            superloggers = _resolve_superloggers(trace, is_main)
+            _superlogger_cache[key] = superloggers
+
+        # ------------------- Get Handler Lists and Level ------------- #
+        # the flattened handler lists, and the level this logger filters
+        # on (its own, a borrowed one, or an overriding superlogger's),
+        # only change when handlers or level settings do, so they are
+        # resolved once per logger and module trace
+        handler_key = (self.lookup, trace, version)
+        try:
+            (superhandlers, bypass_handlers,
+             logger_level, level_exclusive) = _superhandler_cache[handler_key]
+        except KeyError:
+            if len(_superhandler_cache) >= _SUPERLOGGER_CACHE_SIZE:
+                _superhandler_cache.clear()
+            superhandlers, bypass_handlers = _resolve_superhandlers(
+                self, superloggers)
+            logger_level, level_exclusive = self._effective_level(superloggers)
+            _superhandler_cache[handler_key] = (superhandlers, bypass_handlers,
+                                                logger_level, level_exclusive)
 
         # ------------------- Broadcast "Always Evaluate" Handlers ---- #
         # "always evaluate" means ALWAYS evaluate.  These handlers will
         # be called no matter what -- although the handlers themselves
         # can choose to ignore a particular message or level.
-        bypass_handlers = chain.from_iterable([logger.bypass_handlers
-                                               for logger in superloggers])
-        bypass_handlers = list(bypass_handlers)
         if bypass_handlers:
-            # remove duplicate handlers
-            visited = set()
-            visited_add = visited.add
-            bypass_handlers = [bp for bp in bypass_handlers
-                               if bp not in visited and not visited_add(sm)]
             if args:
                 message = message.format(*args)
-            if self.formatter:
-                message = self.formatter(message, level, **kwargs)
+            if self._formatter:
+                message = self._formatter(message, level, **kwargs)
             for handler in bypass_handlers:
                 handler(message, level=level, **kwargs)
 
-        # ------------------- Get Overriding Level (If Any) ----------- #
-        if not self.borrow_level_from:
-            level_overriders = [sl for sl in superloggers
-                                if sl.overrides_submodule_level]
-            if level_overriders:
-                overrider = list(level_overriders)[-1]
-                logger_level = overrider.level
-                level_exclusive = overrider.level_exclusive
-            else:
-                logger_level = self.level
-                level_exclusive = self.level_exclusive
-        else:
-            try:
-                borrowlogger = _logger_cache[self.borrow_level_from]
-            except:
-                logger_level = self.level
-                level_exclusive = self.level_exclusive
-            else:
-                logger_level = borrowlogger.level
-                level_exclusive = borrowlogger.level_exclusive
-
         # ------------------- Logger Level Filter --------------------- #
         if level_exclusive and level != logger_level:
             return
         elif not level_exclusive and level > logger_level:
             return
-
-        # ------------------- Build Handler Lists --------------------- #
-        # get handlers from each module's loggers
-        if superloggers:
-            superhandlers = chain.from_iterable([superlogger.handlers
-                                                 for superlogger in superloggers])
-        else:
-            superhandlers = self.handlers
-
-        visited = set()
-        visited_add = visited.add
-        # remove duplicate handlers
-        superhandlers = [sh for sh in superhandlers if sh not in visited
-                         and not visited_add(sm)]
+        elif not superhandlers:
+            # nobody left to receive the message, so don't format it
+            return
 
         # ------------------- Format Message if Not Already ----------- #
-        if args and not bypass_handlers:
-            message = message.format(*args)
-        if not bypass_handlers and self.formatter:
-            message = self.formatter(message, level, **kwargs)
+        # str.format parses its template in C; a cache of pre-split
+        # templates joined back together in Python measures no faster,
+        # so templates are simply formatted, and only when there are args
+        if not bypass_handlers:
+            if args:
+                message = message.format(*args)
+            if self._formatter:
+                message = self._formatter(message, level, **kwargs)
 
         # ------------------- Broadcast ------------------------------- #
         for handler in superhandlers:
             handler(message, level=level, **kwargs)
 
+    def _broadcast_standalone(self, message, level, args, kwargs):
+        """broadcast for standalone loggers, which only use their own
+        handlers.  They have no level of their own to filter on, so the
+        handlers are asked first, and the message is only formatted for
+        those which care"""
+        handlers = _accepting_handlers(chain(self.handlers,
+                                             self.bypass_handlers),
+                                       level)
+        if not handlers:
+            return
+        if args:
+            message = message.format(*args)
+        for handler in handlers:
+            handler(message, level=level, **kwargs)
+
+    def _effective_level(self, superloggers):
+        """return the level and level_exclusive setting which apply to a
+        broadcast, given the borrowed level or the outermost overriding
+        superlogger, if any"""
+        if self._borrow_level_from:
+            try:
+                borrowlogger = _logger_cache[self._borrow_level_from]
+            except KeyError:
+                return self._level, self._level_exclusive
+            return borrowlogger._level, borrowlogger._level_exclusive
+        level_overriders = [sl for sl in superloggers
+                            if sl._overrides_submodule_level]
+        if level_overriders:
+            overrider = level_overriders[-1]
+            return overrider._level, overrider._level_exclusive
+        return self._level, self._level_exclusive
+
     # ---------------------------------------------- Handle Messages -- #
     def exception(self, message, *args, **kwargs):
-        """log exceptions which are expected to kill the application."""
-        kwargs['exc_info'] = sys.exc_info()
-        with handler_lock:
-            self.broadcast(message, level=0, *args, **kwargs)
+        """log exceptions which are expected to kill the application.
+        The exception currently being handled is passed to the handlers
+        as exc_info, unless the caller supplies its own."""
+        # the ceiling accounts for always-evaluate handlers, so nothing
+        # is captured for a message nobody will see
+        if 0 > self._level_ceiling:
+            return
+        if 'exc_info' not in kwargs:
+            kwargs['exc_info'] = sys.exc_info()
+        self._broadcast(message, 0, args, kwargs)
 
     def error(self, message, *args, **kwargs):
         """Indicates an error has definitely occurred, but not
         necessarily that the program will stop running.
         """
-        with handler_lock:
-            self.broadcast(message, level=1, *args, **kwargs)
+        if 1 > self._level_ceiling:
+            return
+        self._broadcast(message, 1, args, kwargs)
 
     def warning(self, message, *args, **kwargs):
         """log warnings that are useful to know, but won't completely
         stop an application from running
         """
-        with handler_lock:
-            self.broadcast(message, level=2, *args, **kwargs)
+        if 2 > self._level_ceiling:
+            return
+        self._broadcast(message, 2, args, kwargs)
 
     def info(self, message, *args, **kwargs):
         """log information useful to the user."""
-        with handler_lock:
-            self.broadcast(message, level=3, *args, **kwargs)
+        if 3 > self._level_ceiling:
+            return
+        self._broadcast(message, 3, args, kwargs)
 
     def debug(self, message, *args, **kwargs):
         """log information useful to programmers for debugging"""
-        with handler_lock:
-            self.broadcast(message, level=4, *args, **kwargs)
+        if 4 > self._level_ceiling:
+            return
+        self._broadcast(message, 4, args, kwargs)
 
     def write(self, message, *args, **kwargs):
         """straight output"""
-        with handler_lock:
-            self.broadcast(message, level=-1, *args, **kwargs)
+        if -1 > self._level_ceiling:
+            return
+        self._broadcast(message, -1, args, kwargs)
 
     def __repr__(self):
         return "<slog.Logger for '{0}'>".format(self.lookup)
@@ -480,13 +786,16 @@ class Handler(object):
         self.always_evaluate = always_evaluate
         self.level_exclusive = level_exclusive
         self.level = level if level else 100
-        self.verb_map = {99: self.no_action,
-                         4: self.handle_debug,
-                         3: self.handle_info,
-                         2: self.handle_warning,
-                         1: self.handle_error,
-                         0: self.handle_exception,
-                         -1: self.handle}
+        # dispatch methods for levels -1 through 4, indexed by level + 1.
+        # verb_map covers the same levels (plus NO_ACTION) by key.
+        self._verbs = (self.handle,
+                       self.handle_exception,
+                       self.handle_error,
+                       self.handle_warning,
+                       self.handle_info,
+                       self.handle_debug)
+        self.verb_map = dict(zip(range(-1, 5), self._verbs))
+        self.verb_map[99] = self.no_action
 
     def __call__(self, message, level=DEFAULT_VERBOSITY, **kwargs):
         """Makes the Handler instance callable.  If the dispatch method
@@ -500,7 +809,12 @@ class Handler(object):
                 return
             elif self.level_exclusive and level != self.level:
                 return
-        level_method = self.verb_map[level]
+        # a negative index would wrap around to the wrong verb, so only
+        # the levels the tuple covers are looked up by position
+        if -1 <= level < 5:
+            level_method = self._verbs[level + 1]
+        else:
+            level_method = self.verb_map[level]
         if self.formatter:
             message = self.formatter(message, level, **kwargs)
         level_method(message, level, **kwargs)
@@ -557,14 +871,95 @@ class Handler(object):
 class BaseLogHandler(Handler):
     """HANDLER:
     use sys.stdout.write to output to the console
+
+    By default every message is written straight away.  With a
+    buffer_size, messages are collected and written in one go once that
+    many characters are waiting, when flush() is called, or at exit.
+    Errors and exceptions are never held back.
     """
     base_verbosity = 5
 
-    def __init__(self):
+    def __init__(self, buffer_size=0):
         super(BaseLogHandler, self).__init__(level=self.base_verbosity)
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._buffer_lock = threading.Lock()
+        if buffer_size:
+            atexit.register(self.flush)
 
     def handle(self, message, level, **kwargs):
-        sys.stdout.write('{}'.format(message))
+        message = '{}'.format(message)
+        if not self.buffer_size:
+            sys.stdout.write(message)
+            return
+        with self._buffer_lock:
+            self._buffer.append(message)
+            self._buffered += len(message)
+            if self._buffered < self.buffer_size and level > ERROR:
+                return
+            self._flush()
+
+    def flush(self):
+        """write out any buffered messages"""
+        with self._buffer_lock:
+            self._flush()
+
+    def _flush(self):
+        # callers hold the buffer lock
+        if self._buffer:
+            sys.stdout.write(''.join(self._buffer))
+            self._buffer = []
+            self._buffered = 0
+
+class MultiStreamHandler(Handler):
+    """HANDLER:
+    write each message to several streams at once (stderr and an open
+    log file, for instance).  The message is formatted once for all of
+    them, rather than once per handler.
+
+    buffer_size works as it does for BaseLogHandler: waiting messages
+    are joined and written with a single write() per stream.
+    """
+    __slots__ = ('streams', 'buffer_size', '_buffer', '_buffered',
+                 '_buffer_lock')
+
+    def __init__(self, streams, level=ALWAYS_HANDLE, buffer_size=0, **kwargs):
+        super(MultiStreamHandler, self).__init__(level=level, **kwargs)
+        self.streams = list(streams)
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._buffer_lock = threading.Lock()
+        if buffer_size:
+            atexit.register(self.flush)
+
+    def handle(self, message, level, **kwargs):
+        message = '{}'.format(message)
+        if not self.buffer_size:
+            for stream in self.streams:
+                stream.write(message)
+            return
+        with self._buffer_lock:
+            self._buffer.append(message)
+            self._buffered += len(message)
+            if self._buffered < self.buffer_size and level > ERROR:
+                return
+            self._flush()
+
+    def flush(self):
+        """write out any buffered messages"""
+        with self._buffer_lock:
+            self._flush()
+
+    def _flush(self):
+        # callers hold the buffer lock
+        if self._buffer:
+            data = ''.join(self._buffer)
+            self._buffer = []
+            self._buffered = 0
+            for stream in self.streams:
+                stream.write(data)
 
 # ----------------------------------------------------- Handler Templates -- #
 class DeferredHandler(Handler):
@@ -580,20 +975,34 @@ class DeferredHandler(Handler):
         levels."""
         super(DeferredHandler, self).__init__(always_evaluate=True, **kwargs)
         self.cache_levels = cache_levels or [0, 1, 2, 3, 4, 5]
-        self.cache = deque(maxlen=max_cache_size)
+        self.max_cache_size = max_cache_size
+        self.cache = self._new_cache()
+        # guards swapping the cache out in dump against appends made by
+        # other threads.  Messages are pushed out after it is released.
+        self._lock = threading.Lock()
 
     def dump(self):
         """push out all cached messages"""
-        for message, level in self.cache:
-            level_method = self.verb_map[level]
-            level_method(message, level)
-        self.cache = []
+        with self._lock:
+            cache = self.cache
+            self.cache = self._new_cache()
+        verb_map = self.verb_map
+        for message, level in cache:
+            verb_map[level](message, level)
+
+    def _new_cache(self):
+        """bounded caches keep only the most recent messages, in a
+        pre-allocated ring buffer"""
+        if self.max_cache_size is None:
+            return deque()
+        return RingBuffer(self.max_cache_size)
 
     def __call__(self, message, level, **kwargs):
         if level in self.cache_levels:
             if self.formatter:
                 message = self.formatter(message, level, **kwargs)
-            self.cache.append((message, level))
+            with self._lock:
+                self.cache.append((message, level))
 
 class JustInCaseHandler(DeferredHandler):
     """HANDLER:
@@ -611,19 +1020,247 @@ class JustInCaseHandler(DeferredHandler):
         if level <= self.trigger_level:
             self.dump()
 
+class AsyncHandler(Handler):
+    """HANDLER:
+    pass messages on to another handler from a background thread.  The
+    logging call only queues the message; formatting and output happen
+    on the thread, in batches.  The queue can be bounded with
+    max_queue_size, in which case overflow is either BLOCK or
+    DROP_OLDEST.  Unless join_main is turned off, everything queued is
+    handled before the interpreter exits.
+    """
+    def __init__(self, handler, max_queue_size=0, overflow=BLOCK,
+                 join_main=True, **kwargs):
+        super(AsyncHandler, self).__init__(**kwargs)
+        self.handler = handler
+        self.queue = _LogQueue(max_queue_size, overflow)
+        self.wakeup = threading.Event()
+        self.sleeping = False
+        self.queue.writer = self
+        if join_main:
+            _exit_queues[self] = self.queue
+        self.thread = threading.Thread(target=self.run)
+        self.thread.setDaemon(True)
+        self.thread.start()
+
+    def __call__(self, message, level=DEFAULT_VERBOSITY, **kwargs):
+        if not self.always_evaluate:
+            if not self.level_exclusive and level > self.level:
+                return
+            elif self.level_exclusive and level != self.level:
+                return
+        self.queue.put((message, level, kwargs))
+
+    def run(self):
+        """hand each batch of queued messages to the wrapped handler"""
+        queue = self.queue
+        wakeup = self.wakeup
+        while True:
+            batch = queue.take_all()
+            if batch is None:
+                # see _FileWriter.run for why the flag is raised first
+                wakeup.clear()
+                self.sleeping = True
+                if not queue._entries:
+                    wakeup.wait()
+                self.sleeping = False
+                continue
+            try:
+                self._handle_batch(batch)
+            finally:
+                queue.batch_done()
+
+    def _handle_batch(self, batch):
+        formatter = self.formatter
+        handler = self.handler
+        for message, level, kwargs in batch:
+            try:
+                if formatter:
+                    message = formatter(message, level, **kwargs)
+                handler(message, level=level, **kwargs)
+            except Exception as err:
+                # one bad message mustn't stop the thread
+                sys.stderr.write('slog: could not handle message: '
+                                 '{0}\n'.format(err))
+
+    def flush(self):
+        """wait until every message queued so far has been handled"""
+        self.queue.join()
+
+    def enter_handler(self):
+        """enter the wrapped handler, if it is a Handler"""
+        enter = getattr(self.handler, 'enter_handler', None)
+        if enter:
+            enter()
+
+    def exit_handler(self):
+        """handle everything still queued, then exit the wrapped handler"""
+        self.flush()
+        exit_ = getattr(self.handler, 'exit_handler', None)
+        if exit_:
+            exit_()
+
 # -------------------------------------------------------------------------- #
 # ----------------------------------------------------- File Log Handling -- #
-def _file_logging_op(q):
-    """Queue processing for threaded file logging"""
-    while True:
+class _LogQueue(object):
+    """The job queue shared by every FileLogHandler writing to one file,
+    or owned by an AsyncHandler.
+
+    Any number of threads may put entries, but only the queue's writer
+    thread takes them off.  deque.append and popleft are atomic under the
+    GIL, so putting an entry never takes a lock, and the writer is only
+    signalled when it is actually asleep waiting for work.  A bounded
+    queue either makes producers wait (BLOCK) or quietly discards the
+    oldest entries (DROP_OLDEST).
+    """
+    def __init__(self, maxsize=0, overflow=BLOCK):
+        self.maxsize = maxsize
+        self.overflow = overflow
+        if maxsize and overflow == DROP_OLDEST:
+            self._entries = deque(maxlen=maxsize)
+        else:
+            self._entries = deque()
+        self._busy = False
+        # the _FileWriter serving this queue, see get_file_thread
+        self.writer = None
+
+    def put(self, entry):
+        """add an entry for the writer thread"""
+        entries = self._entries
+        if self.maxsize and entries.maxlen is None:
+            # blocking is the rare case, so simply poll for room
+            while len(entries) >= self.maxsize:
+                time.sleep(0.001)
+        entries.append(entry)
+        writer = self.writer
+        if writer is not None and writer.sleeping:
+            writer.wakeup.set()
+
+    def take_all(self):
+        """WRITER ONLY: remove and return every waiting entry.  If there
+        were any, batch_done must be called once they have been dealt
+        with"""
+        entries = self._entries
+        if not entries:
+            return None
+        self._busy = True
+        popleft = entries.popleft
+        batch = []
+        batch_append = batch.append
         try:
-            # grab the latest log entry
-            logpath, log_data = q.get()
-        except TypeError:
-            # if the queue is passed None, shut down the thread
-            return
-        _log_it(logpath, log_data)
-        q.task_done()
+            while True:
+                batch_append(popleft())
+        except IndexError:
+            pass
+        return batch
+
+    def batch_done(self):
+        """WRITER ONLY: mark the last batch as written"""
+        self._busy = False
+
+    def join(self, timeout=None):
+        """wait until every entry put so far has been written.  Gives up
+        if the writer thread has died, or after timeout seconds.  Returns
+        whether everything was written"""
+        deadline = None if timeout is None else time.time() + timeout
+        while self._entries or self._busy:
+            writer = self.writer
+            if writer is not None and not writer.thread.is_alive():
+                return False
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+class _FileWriter(object):
+    """A background thread which writes out the queues of any number of
+    files.  Each file is served by exactly one writer, so the lines of a
+    file always come out in the order they were queued."""
+    def __init__(self):
+        # (logpath, queue) pairs.  Replaced rather than mutated, so the
+        # writer thread always iterates a consistent snapshot.
+        self.queues = ()
+        self.wakeup = threading.Event()
+        self.sleeping = False
+        self.thread = threading.Thread(target=self.run)
+        self.thread.setDaemon(True)
+        self.thread.start()
+
+    def add_queue(self, logpath, queue):
+        queue.writer = self
+        self.queues += ((logpath, queue),)
+        self.wakeup.set()
+
+    def run(self):
+        """Every entry already waiting in a queue is taken at once, so a
+        burst of messages costs one open and write per file rather than
+        one per message."""
+        wakeup = self.wakeup
+        while True:
+            written = False
+            for logpath, queue in self.queues:
+                batch = queue.take_all()
+                if batch is None:
+                    continue
+                written = True
+                try:
+                    _log_batch(logpath, batch)
+                except Exception as err:
+                    # one unwritable file (or unwritable message) mustn't
+                    # stop the writer serving every other file
+                    warning = 'slog: could not write to {0}: {1}\n'
+                    sys.stderr.write(warning.format(logpath, err))
+                finally:
+                    queue.batch_done()
+            if written:
+                continue
+            # the flag is raised before the final check, so a put landing
+            # in between always sees it and wakes us up
+            wakeup.clear()
+            self.sleeping = True
+            if not any([queue._entries for _, queue in self.queues]):
+                wakeup.wait()
+            self.sleeping = False
+
+def _log_batch(logpath, batch):
+    """format and write a batch of queued entries.  An entry is either a
+    message ready to be written, or a (message, level, formatter, kwargs)
+    tuple still to be formatted"""
+    lines = []
+    lines_append = lines.append
+    for entry in batch:
+        if type(entry) is tuple:
+            log_data, level, formatter, kwargs = entry
+            if formatter:
+                try:
+                    log_data = formatter(log_data, level, **kwargs)
+                except Exception:
+                    # a broken formatter must not take the writer thread
+                    # down with it; the unformatted message is better
+                    # than nothing
+                    pass
+            lines_append(log_data)
+        else:
+            lines_append(entry)
+    _log_it(logpath, lines)
+
+# queues which must be completely written out before the interpreter exits.
+# writer threads are daemons, so without this they would simply be killed
+_exit_queues = {}
+# the longest the interpreter will wait on _exit_queues, in seconds, so a
+# stuck writer can't hang the exit
+EXIT_JOIN_TIMEOUT = 10.0
+
+def _join_exit_queues():
+    """wait for every queue registered by a joining FileLogHandler, or
+    AsyncHandler, for up to EXIT_JOIN_TIMEOUT seconds in all"""
+    deadline = time.time() + EXIT_JOIN_TIMEOUT
+    for queue in list(_exit_queues.values()):
+        if not queue.join(max(deadline - time.time(), 0)):
+            sys.stderr.write('slog: gave up waiting for queued log '
+                             'messages at exit\n')
+
+atexit.register(_join_exit_queues)
 
 def _log_it(logpath, log_data):
     """write a log to the specified logpath"""
@@ -632,17 +1269,28 @@ def _log_it(logpath, log_data):
 
 class FileLogHandler(Handler):
     """Write log to a file location, using a new thread to handle output.
-    The new thread will rejoin the main thread upon exiting, making this
+    Logging calls never wait on the disk.  If join_main is set, the
+    handler's queue is instead joined when the handler is removed and
+    when the interpreter exits, so no messages are lost.  This makes the
     handler mostly useful for UI-bound applications where you want to
     maintain responsiveness but still write log files.
 
+    If synchronous is set, the handler skips the thread entirely and
+    writes each message before returning, through a file it keeps open
+    until exit_handler.  For small, infrequent writes this is cheaper
+    than the round trip to a writer thread.
+
     Note on threading:
-    Every FileLogHandler instance will spin up a new thread upon being
-    added to a logger, but will share a job queue with any other
-    FileLogHandler which points to the same file.
+    Every FileLogHandler shares a job queue with any other FileLogHandler
+    which points to the same file.  Files are written by a small pool of
+    background threads (see FILE_WRITER_COUNT), one thread per file.
+    max_queue_size bounds that queue, and overflow determines what
+    happens when it is full: BLOCK or DROP_OLDEST.  The first handler to
+    use a file decides both.
     """
     def __init__(self, filepath=None, header=None, footer=None, clear_existing=False,
-                 join_main=True, *args, **kwargs):
+                 join_main=False, max_queue_size=0, overflow=BLOCK,
+                 synchronous=False, *args, **kwargs):
         # super call allows setting of level and handler-mapping
         super(FileLogHandler, self).__init__(*args, **kwargs)
         self.filepath = filepath
@@ -650,19 +1298,75 @@ class FileLogHandler(Handler):
         self.header = header
         self.footer = footer
         self.join_main = join_main
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.synchronous = synchronous
         self.clear_existing = clear_existing
+        # open files for synchronous writes, by path
+        self._files = {}
+        self._files_lock = threading.Lock()
         self.formatter = None
         self.op_queue = Queue()
 
+    def __call__(self, message, level=DEFAULT_VERBOSITY, **kwargs):
+        """filter the message like any other Handler, but leave the
+        formatting to the writer thread"""
+        if not self.always_evaluate:
+            if not self.level_exclusive and level > self.level:
+                return
+            elif self.level_exclusive and level != self.level:
+                return
+        # a negative index would wrap around to the wrong verb, so only
+        # the levels the tuple covers are looked up by position
+        if -1 <= level < 5:
+            level_method = self._verbs[level + 1]
+        else:
+            level_method = self.verb_map[level]
+        level_method(message, level, _formatter=self.formatter, **kwargs)
+
     def handle(self, message, *args, **kwargs):
         """write the message onto the next line of the logfile"""
         path = kwargs.pop('filepath', self.filepath)
-        log_queue = get_file_queue(path)
+        formatter = kwargs.pop('_formatter', None)
+        join_main = kwargs.pop('join_main', False) or self.join_main
+        if message is None:
+            return
+        # ------------------- Write Inline, if Synchronous ----------------- #
+        if self.synchronous:
+            if formatter:
+                message = formatter(message, args[0] if args else None,
+                                    **kwargs)
+            self._write_now(path, message)
+            return
+        log_queue = get_file_queue(path, self.max_queue_size, self.overflow)
         get_file_thread(path, log_queue)
-        log_queue.put((path, message))
-        # ------------------- Join Main Thread ----------------------------- #
-        if self.join_main:
+        # ------------------- Join Main Thread at Exit --------------------- #
+        if join_main:
+            _exit_queues[path] = log_queue
+        # ------------------- Enqueue -------------------------------------- #
+        # each file has its own queue, so the path isn't queued, and
+        # messages with nothing left to do are queued as they are.  The
+        # formatter (if any) is called by the writer thread, with the same
+        # level and kwargs it would have been given here.
+        if formatter or type(message) is tuple:
+            level = args[0] if args else None
+            log_queue.put((message, level, formatter, kwargs))
+        else:
+            log_queue.put(message)
+
+    def _write_now(self, path, message):
+        """write the message on the calling thread"""
+        # anything other handlers have queued for the file goes first
+        log_queue = cached_queues.get(path)
+        if log_queue is not None:
             log_queue.join()
+        with self._files_lock:
+            try:
+                log = self._files[path]
+            except KeyError:
+                log = self._files[path] = open(path, 'a+')
+            log.write(message)
+            log.flush()
 
     def enter_handler(self):
         """write the header to the file if one exists"""
@@ -681,11 +1385,123 @@ class FileLogHandler(Handler):
             self.handle(self.header)
 
     def exit_handler(self):
-        """rejoin the main thread, write the footer, and close"""
+        """write the footer, and if join_main is set, wait for everything
+        queued for the file to be written"""
         if self.footer:
             self.handle(self.footer)
-        self.handle(None)
-        self.log_queue.join()
+        if self.join_main and self.filepath:
+            get_file_queue(self.filepath).join()
+        # ------------------- Close Synchronous Files ---------------------- #
+        with self._files_lock:
+            for log in self._files.values():
+                log.close()
+            self._files.clear()
+
+# --------------------------------------------------------- Binary Format -- #
+# a binary log is a run of records, each starting with a one-byte tag:
+# * _BINARY_STRING: a message's index and byte length, then its text
+# * _BINARY_ENTRY: level, time.time(), and the index of its message
+# each distinct message is written out once, and is referred to by index
+# from then on.  read_binary_log turns a file back into entries.
+_BINARY_STRING = 0
+_BINARY_ENTRY = 1
+_binary_string_struct = struct.Struct('<BII')
+_binary_entry_struct = struct.Struct('<BbdI')
+# remembered messages are forgotten past this many, then written out again
+# if they come back.  Indices keep counting up, so nothing is ambiguous
+_BINARY_STRING_LIMIT = 65536
+# binary handlers whose files are flushed at exit.  Held weakly, so a
+# handler that is dropped takes its open file with it
+_binary_handlers = weakref.WeakSet()
+
+def _flush_binary_handlers():
+    """flush every BinaryLogHandler still alive at exit"""
+    for handler in list(_binary_handlers):
+        handler.flush()
+
+atexit.register(_flush_binary_handlers)
+
+class BinaryLogHandler(Handler):
+    """Write a compact binary log, for high-volume logging where building
+    a line of text for every message would cost more than the logging
+    itself.  Repeated messages cost a fixed 14 bytes each.  Use
+    read_binary_log to get the entries back out.
+    """
+    def __init__(self, filepath, level=ALWAYS_HANDLE, clear_existing=False,
+                 **kwargs):
+        super(BinaryLogHandler, self).__init__(level=level, **kwargs)
+        self.filepath = filepath
+        self.clear_existing = clear_existing
+        self._file = None
+        self._indices = {}
+        self._next_index = 0
+        self._lock = threading.Lock()
+        _binary_handlers.add(self)
+
+    def handle(self, message, level, **kwargs):
+        if type(message) is unicode:
+            message = message.encode('utf-8')
+        elif type(message) is not str:
+            message = '{}'.format(message)
+        timestamp = time.time()
+        with self._lock:
+            log = self._file
+            if log is None:
+                mode = 'wb' if self.clear_existing else 'ab'
+                log = self._file = open(self.filepath, mode)
+            indices = self._indices
+            try:
+                index = indices[message]
+            except KeyError:
+                if len(indices) >= _BINARY_STRING_LIMIT:
+                    indices.clear()
+                index = indices[message] = self._next_index
+                self._next_index += 1
+                log.write(_binary_string_struct.pack(
+                    _BINARY_STRING, index, len(message)))
+                log.write(message)
+            log.write(_binary_entry_struct.pack(
+                _BINARY_ENTRY, level, timestamp, index))
+
+    def flush(self):
+        """push everything written so far out to the file"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def enter_handler(self):
+        safe_make_dir(self.filepath)
+
+    def exit_handler(self):
+        """close the file; it is reopened if the handler is used again"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                # a reopened file starts without any of our messages
+                self._indices.clear()
+                self.clear_existing = False
+
+def read_binary_log(filepath):
+    """generate (level, timestamp, message) for each entry of a log
+    written by a BinaryLogHandler"""
+    strings = {}
+    string_size = _binary_string_struct.size
+    entry_size = _binary_entry_struct.size
+    with open(filepath, 'rb') as log:
+        read = log.read
+        while True:
+            tag = read(1)
+            if not tag:
+                return
+            if ord(tag) == _BINARY_STRING:
+                _, index, length = _binary_string_struct.unpack(
+                    tag + read(string_size - 1))
+                strings[index] = read(length)
+            else:
+                _, level, timestamp, index = _binary_entry_struct.unpack(
+                    tag + read(entry_size - 1))
+                yield level, timestamp, strings[index]
 
 # -------------------------------------------------------------------------- #
 # ------------------------------------------------------------ FORMATTERS -- #
@@ -698,27 +1514,41 @@ def base_newline_formatter(msg, lvl, **kwargs):
     LEVELNAME: message\n
     (this formatter DOES append a newline)
     """
-    formatted_msg = base_formatter(msg, lvl, **kwargs)
-    return '{0}\n'.format(formatted_msg)
+    return _format_record(msg, lvl, kwargs.get('label', None), '\n')
 
 def base_formatter(msg, lvl, **kwargs):
     """return the message in the format:
     LEVELNAME: message
     (this formatter does NOT append a newline)
     """
-    custom_label = kwargs.get('label', None)
-    if custom_label:
-        label = custom_label
+    return _format_record(msg, lvl, kwargs.get('label', None), '')
+
+# the label prefix and multi-line indent for every level are built once, so
+# formatting a record is a single concatenation
+_LEVEL_PREFIXES = dict((lvl, '{0}: '.format(name))
+                       for lvl, name in LEVEL_LOOKUP.items())
+_LEVEL_SPACERS = dict((lvl, '\n  {0}'.format(' ' * len(name)))
+                      for lvl, name in LEVEL_LOOKUP.items())
+
+def _format_record(msg, lvl, label, end):
+    """shared body of the base formatters; end is appended to the line"""
+    if label:
+        prefix = '{0}: '.format(label)
+        spacer = '\n  {0}'.format(' ' * len(label))
     else:
-        label = LEVEL_LOOKUP[lvl]
+        prefix = _LEVEL_PREFIXES[lvl]
+        spacer = _LEVEL_SPACERS[lvl]
+    if type(msg) is str:
+        if '\n' in msg:
+            msg = msg.replace('\n', spacer)
+        return prefix + msg + end
+    # anything else is converted exactly as str.format would
     try:
-        if "\n" in msg:
-            spacer = '\n  {0}'.format(' ' * len(label))
+        if '\n' in msg:
             msg = spacer.join(msg.split('\n'))
     except TypeError:
         pass
-    msg = "{0}: {1}".format(label, msg)
-    return msg
+    return '{0}{1}{2}'.format(prefix, msg, end)
 
 def context_formatter(ctx):
     def formatted_with_context(msg, _):
@@ -731,56 +1561,108 @@ def context_formatter(ctx):
 
 # ------------------------------------------------------------- Factories -- #
 cached_queues = dict()
-def get_file_queue(filename):
-    return cached_queues.setdefault(filename, Queue(maxsize=0))
+def get_file_queue(filename, maxsize=0, overflow=BLOCK):
+    try:
+        return cached_queues[filename]
+    except KeyError:
+        return cached_queues.setdefault(filename,
+                                        _LogQueue(maxsize, overflow))
 
 
 cached_threads = dict()
 
+# files are spread over at most this many writer threads
+FILE_WRITER_COUNT = 4
+_file_writers = []
+_file_thread_lock = threading.Lock()
+
 def get_file_thread(filename, queue):
-    if filename in cached_threads:
+    """return the thread writing the given file, handing the file to a
+    writer if it doesn't have one yet"""
+    try:
         return cached_threads[filename]
-    # ------------------- Spin up Thread ----------------------------------- #
-    handler_thread = threading.Thread(target=_file_logging_op,
-                                      args=(queue,))
-    handler_thread.setDaemon(True)
-    handler_thread.start()
-    return handler_thread
+    except KeyError:
+        pass
+    # each file's queue must have exactly one writer, so files are only
+    # ever handed out while holding the lock
+    with _file_thread_lock:
+        if filename in cached_threads:
+            return cached_threads[filename]
+        # ------------------- Pick a Writer -------------------------------- #
+        # new writers are started until there are FILE_WRITER_COUNT of
+        # them, after which files are shared round-robin
+        index = len(cached_threads) % FILE_WRITER_COUNT
+        if index < len(_file_writers):
+            writer = _file_writers[index]
+        else:
+            writer = _FileWriter()
+            _file_writers.append(writer)
+        writer.add_queue(filename, queue)
+        cached_threads[filename] = writer.thread
+        return writer.thread
 
 # ------------------------------------------------------ Context Managers -- #
 @contextmanager
 def alternate_root(logger):
+    """temporarily use the given logger as the outermost logger for every
+    broadcast.  Blocks can be nested, and the previous root is restored
+    even if the block raises."""
     with root_lock:
-        original_root = root_logger
+        original_root = _logger_cache['__main__']
+        if logger is original_root:
+            # nothing changes, so the resolved caches all stay valid
+            yield
+            return
         _logger_cache['__main__'] = logger
-        yield
-        _logger_cache['__main__'] = original_root
+        _invalidate_superloggers()
+        _refresh_level_ceilings()
+        try:
+            yield
+        finally:
+            _logger_cache['__main__'] = original_root
+            _invalidate_superloggers()
+            _refresh_level_ceilings()
 
 # --------------------------------------------------------- Log Functions -- #
+# each function checks the root logger's level ceiling itself, so filtered
+# messages return without ever calling into the Logger
+
 def write(message, *args, **kwargs):
     """log any entry"""
+    if -1 > root_logger._level_ceiling:
+        return
     root_logger.write(message, *args, **kwargs)
 
 def exception(message, *args, **kwargs):
     """log an exception which is expected to kill the program"""
+    if EXCEPTION > root_logger._level_ceiling:
+        return
     root_logger.exception(message, *args, **kwargs)
 
 def error(message, *args, **kwargs):
     """top-level error logging.  Indicates a fatal error has occurred, but
     a crash is not imminent"""
+    if ERROR > root_logger._level_ceiling:
+        return
     root_logger.error(message, *args, **kwargs)
 
 def warning(message, *args, **kwargs):
     """log warnings that are useful to know, but won't completely stop
     an application from running"""
+    if WARNING > root_logger._level_ceiling:
+        return
     root_logger.warning(message, *args, **kwargs)
 
-def info(message, level=3, *args, **kwargs):
+def info(message, *args, **kwargs):
     """log information useful to the user."""
+    if INFO > root_logger._level_ceiling:
+        return
     root_logger.info(message, *args, **kwargs)
 
-def debug(message, level=4, *args, **kwargs):
+def debug(message, *args, **kwargs):
     """log information useful to programmers for debugging"""
+    if DEBUG > root_logger._level_ceiling:
+        return
     root_logger.debug(message, *args, **kwargs)
 
 
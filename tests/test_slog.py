@@ -0,0 +1,124 @@
+# -------------------------------------------------------------------------- #
+# ---------------------------------------------------------------- HEADER -- #
+"""
+@organization: Kludgeworks LLC
+
+@description: tests for the background file writers and the broadcast
+              caches in omni.slog
+
+@author: Ed Whetstone
+
+@applications: any
+"""
+# -------------------------------------------------------------------------- #
+# --------------------------------------------------------------- IMPORTS -- #
+
+# built-in
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+# internal
+import vfx_utils.omni.slog as slog
+
+# -------------------------------------------------------------------------- #
+# ----------------------------------------------------------------- TESTS -- #
+class FileWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        # every file is handed to the same writer thread
+        self.writer_count = slog.FILE_WRITER_COUNT
+        slog.FILE_WRITER_COUNT = 1
+
+    def tearDown(self):
+        slog.FILE_WRITER_COUNT = self.writer_count
+        shutil.rmtree(self.tmp_dir)
+
+    def test_bad_handler_does_not_stop_writer(self):
+        """a file which can't be written mustn't stop the writer thread
+        serving every other file"""
+        good_path = os.path.join(self.tmp_dir, 'good.txt')
+        bad_handler = slog.FileLogHandler(filepath=None)
+        good_handler = slog.FileLogHandler(filepath=good_path)
+        good_queue = slog.get_file_queue(good_path)
+        # no path at all, then a message the file can't encode
+        bad_handler.handle('lost\n')
+        self.assertTrue(slog.get_file_queue(None).join(timeout=5))
+        bad_handler.handle(u'lost \xe9\n', filepath=good_path)
+        self.assertTrue(good_queue.join(timeout=5))
+        good_handler.handle('first\n')
+        good_handler.handle('second\n')
+        self.assertTrue(good_queue.join(timeout=5))
+        self.assertTrue(good_queue.writer.thread.is_alive())
+        with open(good_path) as log:
+            self.assertEqual(log.read(), 'first\nsecond\n')
+
+    def test_join_gives_up(self):
+        """a queue with nobody writing it doesn't hang join"""
+        queue = slog._LogQueue()
+        queue.put('never written\n')
+        self.assertFalse(queue.join(timeout=0.05))
+
+
+class _CollectingHandler(slog.Handler):
+    """keeps every message it is handed"""
+    def __init__(self):
+        super(_CollectingHandler, self).__init__(level=slog.DEBUG)
+        self.messages = []
+
+    def handle(self, message, level, **kwargs):
+        self.messages.append(message)
+
+
+class BroadcastCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.resolve_superloggers = slog._resolve_superloggers
+
+    def tearDown(self):
+        slog._resolve_superloggers = self.resolve_superloggers
+
+    def test_logger_created_during_broadcast(self):
+        """a logger created while another thread is resolving the same
+        module trace still receives that trace's later messages"""
+        resolved = threading.Event()
+        release = threading.Event()
+        resolve_superloggers = self.resolve_superloggers
+
+        def paused_resolve(supermodules, is_main):
+            superloggers = resolve_superloggers(supermodules, is_main)
+            if threading.current_thread() is broadcaster:
+                resolved.set()
+                release.wait(5)
+            return superloggers
+
+        def broadcast(message):
+            slog.root_logger.info(message)
+
+        slog._resolve_superloggers = paused_resolve
+        root_handler = _CollectingHandler()
+        module_handler = _CollectingHandler()
+        broadcaster = threading.Thread(target=broadcast,
+                                       args=('from the broadcaster',))
+        # a second thread broadcasts from exactly the same module trace
+        follower = threading.Thread(target=broadcast,
+                                    args=('from the follower',))
+        with slog.root_logger.use_handlers([root_handler]):
+            broadcaster.start()
+            self.assertTrue(resolved.wait(5))
+            # the broadcaster has resolved the trace without this logger
+            module_logger = slog.Logger(__name__)
+            module_logger.add_handler(module_handler)
+            try:
+                release.set()
+                broadcaster.join(5)
+                follower.start()
+                follower.join(5)
+            finally:
+                module_logger.remove_handler(module_handler)
+        self.assertEqual(module_handler.messages, ['from the follower'])
+
+
+if __name__ == '__main__':
+    unittest.main()